@@ -79,17 +79,23 @@ def solve_pt2(byte_tuples):
 default_input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
+def load_input(filename):
+    """ read solver arguments from *filename*. """
+    with open(filename) as f:
+        byte_tuples = tuple(read_bytes(f))
+    return (byte_tuples,)
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * '\n' + 'Solutions for', filename)
-        with open(filename) as f:
-            byte_tuples = tuple(read_bytes(f))
+        args = load_input(filename)
 
-        pt1 = solve_pt1(byte_tuples)
+        pt1 = solve_pt1(*args)
         print('Part 1:', pt1)
-        pt2 = solve_pt2(byte_tuples)
+        pt2 = solve_pt2(*args)
         print('Part 2:', pt2)
 
 
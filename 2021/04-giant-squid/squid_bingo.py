@@ -101,17 +101,23 @@ def solve_pt2(boards, draws):
 default_input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
+def load_input(filename):
+    """ read solver arguments from *filename*. """
+    with open(filename) as f:
+        draws, boards = read_bingo(f)
+    return boards, draws
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * '\n' + 'Solutions for', filename)
-        with open(filename) as f:
-            draws, boards = read_bingo(f)
+        args = load_input(filename)
 
-        pt1 = solve_pt1(boards, draws)
+        pt1 = solve_pt1(*args)
         print('Part 1:', pt1)
-        pt2 = solve_pt2(boards, draws)
+        pt2 = solve_pt2(*args)
         print('Part 2:', pt2)
 
 
@@ -84,6 +84,13 @@ class Stacks(object):
         # add crates to top of stack, last one in buffer on top
         self._stacks[to_stack].extend(buffer)
 
+    def copy(self):
+        """ Create an independent copy of these stacks. """
+        obj = type(self)(self.names)
+        for name in self.names:
+            obj._stacks[name].extend(self._stacks[name])
+        return obj
+
     @classmethod
     def from_rows(cls, names, rows):
         """ Create stacks from *rows* of crates. """
@@ -106,6 +113,7 @@ def solve(stacks, ops, group):
     :param bool group:
         If all crates should be moved as a single group (part 2)
     """
+    stacks = stacks.copy()
     for num, from_stack, to_stack in ops:
         stacks.move(num, from_stack, to_stack, group=group)
     return "".join(stacks.top_row)
@@ -118,18 +126,24 @@ solve_pt2 = functools.partial(solve, group=True)
 default_input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
+def load_input(filename):
+    """ Read solver arguments from *filename*. """
+    with open(filename) as f:
+        names, rows, ops = read_input(f)
+    return Stacks.from_rows(names, rows), ops
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * '\n' + 'Solutions for', filename)
-        with open(filename) as f:
-            names, rows, ops = read_input(f)
+        args = load_input(filename)
 
-        pt1 = solve_pt1(Stacks.from_rows(names, rows), ops)
+        pt1 = solve_pt1(*args)
         print('Part 1:', pt1)
 
-        pt2 = solve_pt2(Stacks.from_rows(names, rows), ops)
+        pt2 = solve_pt2(*args)
         print('Part 2:', pt2)
 
 
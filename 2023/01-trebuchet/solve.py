@@ -64,18 +64,24 @@ solve_pt2 = functools.partial(solve, include_words=True)
 default_input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
+def load_input(filename):
+    """ Read solver arguments from *filename*. """
+    with open(filename) as f:
+        lines = list(read_lines(f))
+    return (lines,)
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * '\n' + 'Solutions for', filename)
-        with open(filename) as f:
-            lines = list(read_lines(f))
+        args = load_input(filename)
 
-        pt1 = solve_pt1(lines)
+        pt1 = solve_pt1(*args)
         print('Part 1:', pt1)
 
-        pt2 = solve_pt2(lines)
+        pt2 = solve_pt2(*args)
         print('Part 2:', pt2)
 
 
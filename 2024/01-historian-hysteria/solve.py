@@ -4,67 +4,88 @@ Advent of Code 2024
 `Day 1 <https://adventofcode.com/2024/day/1>`_:
 Historian Hysteria
 """
+import array
+import itertools
+import operator
 import os
 import sys
 
 
 def read_input(f):
-    """ read columns of number pairs from file-like *f* """
-    columns = ([], [])
-    for lineno, raw_line in enumerate(f, 1):
-        line = raw_line.strip()
-        if not line:
-            continue
+    """
+    read columns of number pairs from binary file-like *f*, as sorted arrays.
+
+    All rows are split and converted in bulk, rather than line by line, and
+    each column is sorted once here so that both parts can walk the columns
+    in order.
+    """
+    lines = f.read().splitlines()
+    rows = list(map(bytes.split, lines))
+    numbers = None
+    if set(map(len, rows)) <= {0, 2}:
         try:
-            row = (int(p.strip()) for p in line.split())
-            for col, val in zip(columns, row):
-                col.append(val)
-        except Exception as e:
-            raise ValueError('invalid input on line %d (%r): %s' %
-                             (lineno, line, e))
-    return columns
+            numbers = array.array(
+                'q', map(int, itertools.chain.from_iterable(rows)))
+        except (ValueError, OverflowError):
+            pass
+    if numbers is None:
+        # find the first invalid line, for the error message
+        for lineno, (line, row) in enumerate(zip(lines, rows), 1):
+            try:
+                if len(row) not in (0, 2):
+                    raise ValueError('expected 2 values, got %d'
+                                     % (len(row),))
+                array.array('q', map(int, row))
+            except (ValueError, OverflowError) as e:
+                raise ValueError('invalid input on line %d (%r): %s' %
+                                 (lineno, line.decode(errors='replace'), e))
+        raise ValueError('invalid input')
+    return tuple(array.array('q', sorted(numbers[col::2]))
+                 for col in range(2))
 
 
 def solve_pt1(columns):
-    col_a, col_b = [sorted(c) for c in columns]
-    return sum(abs(a - b) for a, b in zip(col_a, col_b))
-
-
-def get_similarity_lut(column):
-    """ get a similarity lookup table for a column. """
-    lut = {}
-    for location_id in column:
-        if location_id in lut:
-            lut[location_id] += 1
-        else:
-            lut[location_id] = 1
-    return lut
+    col_a, col_b = columns
+    return sum(map(abs, map(operator.sub, col_a, col_b)))
 
 
 def solve_pt2(columns):
     col_a, col_b = columns
-    similarity = get_similarity_lut(col_b)
-    return sum(
-        similarity.get(location_id, 0) * location_id
-        for location_id in col_a
-    )
+    # merge join the runs of equal values in the sorted columns
+    runs_b = itertools.groupby(col_b)
+    value_b, run_b = next(runs_b, (None, None))
+    total = 0
+    for value_a, run_a in itertools.groupby(col_a):
+        while value_b is not None and value_b < value_a:
+            value_b, run_b = next(runs_b, (None, None))
+        if value_b is None:
+            break
+        if value_b == value_a:
+            total += value_a * len(list(run_a)) * len(list(run_b))
+    return total
 
 
 default_input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename, 'rb') as f:
+        columns = read_input(f)
+    return (columns,)
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * '\n' + 'Solutions for', filename)
-        with open(filename) as f:
-            columns = list(read_input(f))
+        args = load_input(filename)
 
-        pt1 = solve_pt1(columns)
+        pt1 = solve_pt1(*args)
         print('Part 1:', pt1)
 
-        pt2 = solve_pt2(columns)
+        pt2 = solve_pt2(*args)
         print('Part 2:', pt2)
 
 
@@ -5,6 +5,7 @@ Advent of Code 2024
 Red-Nosed Reports
 """
 import itertools
+import operator
 import os
 import sys
 
@@ -18,57 +19,208 @@ def read_input(f):
         yield [int(p.strip()) for p in line.split()]
 
 
-def check_report(levels):
-    """ check if report *levels* are safe. """
-    prevdir = 0
-    for prev, curr in itertools.pairwise(levels):
-        diff = curr - prev
-        if abs(diff) > 3:
-            return False
-        currdir = (diff // abs(diff)) if diff else 0
-        if not currdir:
-            return False
-        if prevdir and currdir != prevdir:
-            return False
-        prevdir = currdir
-    return True
+# smallest and largest change between two levels in a safe report
+MIN_STEP = 1
+MAX_STEP = 3
 
 
-def solve_pt1(reports):
-    """ count number of safe *reports* """
-    return sum(check_report(report) for report in reports)
+def _kept_before(levels, dropped, index):
+    """ find the last level before *index* that isn't *dropped* """
+    index -= 1
+    while index in dropped:
+        index -= 1
+    return index if index >= 0 else None
 
 
-def problem_dampener(report):
-    """ generate report candidates by removing a level """
-    yield report
-    for i in range(len(report)):
-        yield report[:i] + report[i+1:]
+def find_violation(levels, sign, dropped=frozenset(), start=0):
+    """
+    find the first unsafe step in a report, from level *start*.
 
+    Levels in *dropped* are skipped.  A step is safe if it changes in the
+    direction of *sign* by *MIN_STEP* to *MAX_STEP*.
 
-def solve_pt2(reports):
-    """ count number of safe *reports* when using the problem dampener """
-    return sum(
-        any(check_report(r) for r in problem_dampener(report))
-        for report in reports
-    )
+    :returns tuple: level indexes of the unsafe step, or None
+    """
+    prev = _kept_before(levels, dropped, start)
+    for curr in range(start, len(levels)):
+        if curr in dropped:
+            continue
+        if prev is not None:
+            step = (levels[curr] - levels[prev]) * sign
+            if not MIN_STEP <= step <= MAX_STEP:
+                return prev, curr
+        prev = curr
+    return None
+
+
+def is_safe(levels, sign, tolerance=0, dropped=frozenset(), start=0):
+    """ check if report *levels* can be made safe in one direction """
+    bad = find_violation(levels, sign, dropped, start)
+    if bad is None:
+        return True
+    if len(dropped) >= tolerance:
+        return False
+    # one of the levels in the unsafe step has to go, and the report is
+    # already known to be safe up to the second one
+    prev, curr = bad
+    return (is_safe(levels, sign, tolerance, dropped | {curr}, curr)
+            or is_safe(levels, sign, tolerance, dropped | {prev}, curr))
+
+
+def check_report(levels, tolerance=0):
+    """
+    check if report *levels* are safe.
+
+    With a *tolerance*, up to that many bad levels may be removed to make
+    the report safe.
+    """
+    return any(is_safe(levels, sign, tolerance) for sign in (1, -1))
+
+
+# levels are packed into one byte per report, with room for a signed step
+MAX_PACKED = 127
+_BIAS = 128
+
+# translation tables from a biased step to 1 (safe) or 0, for each direction
+SAFE_STEPS = {
+    sign: bytes(MIN_STEP <= (i - _BIAS) * sign <= MAX_STEP
+                for i in range(256))
+    for sign in (1, -1)
+}
+
+
+class ReportBatch(object):
+    """
+    reports packed into a padded, column-major matrix of levels.
+
+    Each column of the matrix is a big integer with one byte *lane* per
+    report, and the report lengths are a byte string.  Steps between two
+    columns are computed for all reports with a single subtraction, and
+    checked with a translation table.  Check results are also lanes, set to
+    1 where the report passes, so results for all reports are combined
+    with a single ``&`` or ``|``.
+
+    If the levels span more than *MAX_PACKED*, the reports can't be packed,
+    and are checked one by one instead.
+    """
+
+    def __init__(self, reports):
+        self.reports = reports
+        size = len(reports)
+        levels = list(itertools.chain.from_iterable(reports))
+        low = min(levels, default=0)
+        high = max(levels, default=0)
+        self.packed = (high - low <= MAX_PACKED
+                       and max(map(len, reports), default=0) <= MAX_PACKED)
+        if not self.packed:
+            return
+
+        # reports are sorted by length, so that the levels of all reports
+        # with the same length can be packed together, and split into
+        # columns with slices.  Levels are offset by the lowest level, which
+        # doesn't change the steps.
+        rows = sorted(reports, key=len)
+        self.lengths = bytes(map(len, rows))
+        width = self.lengths[-1] if rows else 0
+        offset = itertools.repeat(low)
+        columns = [[] for _ in range(width)]
+        for length, group in itertools.groupby(rows, key=len):
+            group = list(group)
+            packed = bytes(map(operator.sub,
+                               itertools.chain.from_iterable(group), offset))
+            for i, column in enumerate(columns):
+                if i < length:
+                    column.append(packed[i::length])
+                else:
+                    column.append(bytes(len(group)))
+        self.columns = [int.from_bytes(b''.join(column), 'little')
+                        for column in columns]
+        self._size = size
+        self._all = int.from_bytes(b'\x01' * size, 'little')
+        self._bias = int.from_bytes(bytes((_BIAS,)) * size, 'little')
+
+    def _lanes(self, data, table):
+        return int.from_bytes(data.translate(table), 'little')
+
+    def check_step(self, a, b, sign):
+        """ get lanes where the step from level *a* to *b* is safe """
+        if not 0 <= a < b < len(self.columns):
+            return self._all
+        # biased steps can't borrow from the next lane
+        steps = self.columns[b] + self._bias - self.columns[a]
+        safe = self._lanes(steps.to_bytes(self._size, 'little'),
+                           SAFE_STEPS[sign])
+        # the step is also safe if the report doesn't have level b
+        missing = self._lanes(self.lengths,
+                              bytes(i <= b for i in range(256)))
+        return safe | missing
+
+    def get_safe(self, sign, tolerance=0):
+        """ get lanes where reports are safe in one direction """
+        steps = [self.check_step(i, i + 1, sign)
+                 for i in range(len(self.columns) - 1)]
+        # prefix[i] and suffix[i] have steps before and from step i
+        prefix = [self._all]
+        for step in steps:
+            prefix.append(prefix[-1] & step)
+        safe = prefix[-1]
+        if not tolerance:
+            return safe
+
+        suffix = [self._all]
+        for step in reversed(steps):
+            suffix.append(suffix[-1] & step)
+        suffix.reverse()
+
+        # removing level i drops the steps on either side of it, and
+        # replaces them with a step from level i - 1 to level i + 1
+        for i in range(len(self.columns)):
+            safe |= (prefix[max(i - 1, 0)]
+                     & self.check_step(i - 1, i + 1, sign)
+                     & suffix[min(i + 1, len(steps))])
+        return safe
+
+    def count_safe(self, tolerance=0):
+        """ count safe reports, if up to *tolerance* levels can be removed """
+        if tolerance > 1 or not self.packed:
+            return sum(check_report(report, tolerance)
+                       for report in self.reports)
+        safe = self.get_safe(1, tolerance) | self.get_safe(-1, tolerance)
+        return bin(safe).count('1')
+
+
+def solve_pt1(batch):
+    """ count number of safe reports in a *batch* """
+    return batch.count_safe()
+
+
+def solve_pt2(batch):
+    """ count number of safe reports in a *batch* with the problem dampener """
+    return batch.count_safe(tolerance=1)
 
 
 default_input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename) as f:
+        data = list(read_input(f))
+    # pack once, and share the batch between both parts
+    return (ReportBatch(data),)
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * '\n' + 'Solutions for', filename)
-        with open(filename) as f:
-            data = list(read_input(f))
+        args = load_input(filename)
 
-        pt1 = solve_pt1(data)
+        pt1 = solve_pt1(*args)
         print('Part 1:', pt1)
 
-        pt2 = solve_pt2(data)
+        pt2 = solve_pt2(*args)
         print('Part 2:', pt2)
 
 
@@ -11,7 +11,7 @@ import sys
 
 
 INSTRUCTION_REGEX = re.compile(
-    r"""
+    rb"""
     mul\((\d{1,3}),(\d{1,3})\)
     | do\(\)
     | don't\(\)
@@ -19,31 +19,42 @@ INSTRUCTION_REGEX = re.compile(
     re.VERBOSE,
 )
 
+# longest possible instruction, i.e. len(b"mul(123,123)")
+MAX_INSTRUCTION = 12
 
-def parse_line(line, offset=0):
-    """ find valid instructions in a *line*, starting at *offset* """
-    while offset < len(line):
-        m = INSTRUCTION_REGEX.match(line[offset:])
-        if not m:
-            offset += 1
-            continue
-        if m.string.startswith("mul("):
-            yield "mul", tuple(int(v) for v in m.groups())
-        elif m.string.startswith("do("):
-            yield "enable", True
-        elif m.string.startswith("don't("):
-            yield "enable", False
-        assert (end := m.end()) > 0
-        offset += end
-
-
-def read_input(f):
-    """ find operations and arguments from file-like *f* """
-    for lineno, raw_line in enumerate(f, 1):
-        line = raw_line.strip()
-        if not line:
-            continue
-        yield from parse_line(line)
+CHUNK_SIZE = 64 * 1024
+
+
+def parse_instruction(m):
+    """ get the operation and arguments from an instruction match *m* """
+    if m.group(1):
+        return "mul", (int(m.group(1)), int(m.group(2)))
+    return "enable", m.group() == b"do()"
+
+
+def read_input(f, chunk_size=CHUNK_SIZE):
+    """
+    find operations and arguments from binary file-like *f*.
+
+    The file is read in chunks of *chunk_size*, and scanned once.  The tail
+    of each chunk, where an instruction could be cut off, is kept and
+    scanned again with the next chunk.
+    """
+    tail = b""
+    while True:
+        chunk = f.read(chunk_size)
+        data = tail + chunk
+        # instructions that start before *limit* are always complete
+        limit = len(data) - (MAX_INSTRUCTION - 1) if chunk else len(data)
+        end = 0
+        for m in INSTRUCTION_REGEX.finditer(data):
+            if m.start() >= limit:
+                break
+            yield parse_instruction(m)
+            end = m.end()
+        if not chunk:
+            break
+        tail = data[max(limit, end):]
 
 
 def solve_pt1(items):
@@ -68,18 +79,24 @@ def solve_pt2(items):
 default_input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename, "rb") as f:
+        items = list(read_input(f))
+    return (items,)
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * '\n' + 'Solutions for', filename)
-        with open(filename) as f:
-            items = list(read_input(f))
+        args = load_input(filename)
 
-        pt1 = solve_pt1(items)
+        pt1 = solve_pt1(*args)
         print('Part 1:', pt1)
 
-        pt2 = solve_pt2(items)
+        pt2 = solve_pt2(*args)
         print('Part 2:', pt2)
 
 
@@ -8,13 +8,6 @@ import os
 import sys
 
 
-DIRECTIONS = {
-    'NW': (-1, -1), 'N': (-1, 0), 'NE': (-1, 1),
-    'W': (0, -1), 'E': (0, 1),
-    'SW': (1, -1), 'S': (1, 0), 'SE': (1, 1),
-}
-
-
 def read_map(f):
     """ read position and letter pairs from file-like *f*. """
     rownum = 0
@@ -30,63 +23,172 @@ def read_map(f):
                              (lineno, line, e))
 
 
-def is_word(lettermap, start, direction, word):
-    """ check if *word* is present at a *start* in *lettermap*. """
-    row, col = start
-    row_d, col_d = direction
-    vector = ((row + row_d * i, col + col_d * i) for i in range(len(word)))
-    return "".join(lettermap.get(p, "") for p in vector) == word
+# filler for missing positions, which can't be part of a word
+FILL = "\0"
+
+
+def get_rows(lettermap):
+    """ get the rows of *lettermap* as strings """
+    height = max((row for row, _ in lettermap), default=-1) + 1
+    width = max((col for _, col in lettermap), default=-1) + 1
+    return [
+        "".join(lettermap.get((row, col), FILL) for col in range(width))
+        for row in range(height)
+    ]
+
+
+def get_lines(lettermap):
+    """ get all rows, columns and diagonals of *lettermap* as strings """
+    rows = get_rows(lettermap)
+    lines = list(rows)
+    lines.extend("".join(col) for col in zip(*rows))
+    diagonals = {}
+    antidiagonals = {}
+    for rownum, row in enumerate(rows):
+        for colnum, char in enumerate(row):
+            diagonals.setdefault(rownum - colnum, []).append(char)
+            antidiagonals.setdefault(rownum + colnum, []).append(char)
+    lines.extend("".join(chars) for chars in diagonals.values())
+    lines.extend("".join(chars) for chars in antidiagonals.values())
+    return lines
+
+
+def count_substrings(line, word):
+    """ count occurrences of *word* in *line*, including overlaps """
+    count = 0
+    index = line.find(word)
+    while index >= 0:
+        count += 1
+        index = line.find(word, index + 1)
+    return count
+
+
+class WordMatcher(object):
+    """ an Aho-Corasick automaton, to find many words in a single pass """
+
+    def __init__(self, words):
+        self._goto = [{}]
+        self._matches = [0]
+        for word in words:
+            if not word:
+                raise ValueError("empty word")
+            state = 0
+            for char in word:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._matches.append(0)
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._matches[state] += 1
+
+        # breadth first, so that the fallback of each state is done first
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, child in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                if state:
+                    self._fail[child] = self._goto[fail].get(char, 0)
+                self._matches[child] += self._matches[self._fail[child]]
+                queue.append(child)
+
+    def count(self, text):
+        """ count occurrences of all words in *text* """
+        goto, fail, matches = self._goto, self._fail, self._matches
+        state = 0
+        count = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            count += matches[state]
+        return count
+
+
+def count_words(lines, words):
+    """ count all *words* in *lines*, both forwards and backwards """
+    patterns = list(words) + [word[::-1] for word in words]
+    if len(words) == 1:
+        return sum(count_substrings(line, pattern)
+                   for line in lines for pattern in patterns)
+    matcher = WordMatcher(patterns)
+    return sum(matcher.count(line) for line in lines)
 
 
-def count_words(lettermap, point, word):
-    return sum(
-        is_word(lettermap, point, d, word)
-        for d in DIRECTIONS.values()
-    )
+def solve_pt1(lettermap):
+    return count_words(get_lines(lettermap), ["XMAS"])
 
 
-def solve_pt1(lettermap):
-    # optimize: only consider points starting with "X":
-    candidates = set(p for p in lettermap if lettermap[p] == "X")
-    return sum(count_words(lettermap, point, "XMAS") for point in candidates)
+def _lanes(data, char):
+    """ get a byte per char in *data*, set to 1 where it is *char* """
+    table = bytes(i == ord(char) for i in range(256))
+    return int.from_bytes(data.translate(table), "little")
 
 
-def count_cross_words(lettermap, point, word):
-    """ find number of diagonal *word* in *lettermap* meeting at *point*. """
-    row, col = point
+def count_cross_words(lettermap, word):
+    """
+    count places where two diagonal *word*s cross in the middle.
+
+    The grid is flattened into one string, with a border of fill so that
+    diagonals don't wrap around.  Each letter of the word is then checked
+    for all cells at once, by comparing the grid with a shifted copy of
+    itself.  Results are one byte per cell in a big integer, see _lanes().
+    """
+    if not len(word) % 2:
+        raise ValueError("word must have an odd length: %r" % (word,))
     half = len(word) // 2
-    directions = [DIRECTIONS[d] for d in ("SE", "NE", "SW", "NW")]
-    starting_points = (
-        (row - row_d * half, col - col_d * half)
-        for row_d, col_d in directions
-    )
-    return sum(
-        is_word(lettermap, p, d, word)
-        for p, d in zip(starting_points, directions)
-    )
+    rows = [FILL * half + row + FILL * half for row in get_rows(lettermap)]
+    stride = len(rows[0]) if rows else 0
+    border = FILL * stride * half
+    cells = (border + "".join(rows) + border).encode("latin-1")
+    size = len(cells)
+    pad = FILL.encode("latin-1") * (stride + 1) * half
+    padded = pad + cells + pad
+
+    matches = 0
+    for direction in (stride + 1, stride - 1):
+        forward = backward = int.from_bytes(b"\1" * size, "little")
+        for i in range(len(word)):
+            # the letter that is i - half steps away, for every cell
+            offset = (i - half) * direction
+            start = len(pad) + offset
+            shifted = padded[start:start + size]
+            forward &= _lanes(shifted, word[i])
+            backward &= _lanes(shifted, word[-1 - i])
+        # no carry, since each byte of the sum is at most 4
+        matches += forward + backward
+
+    table = bytes(i == 2 for i in range(256))
+    return matches.to_bytes(size, "little").translate(table).count(1)
 
 
 def solve_pt2(lettermap):
-    # optimize: only consider points meeting at an "A":
-    candidates = set(p for p in lettermap if lettermap[p] == "A")
-    return sum(count_cross_words(lettermap, p, "MAS") == 2 for p in candidates)
+    return count_cross_words(lettermap, "MAS")
 
 
 default_input_file = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename) as f:
+        data = dict(read_map(f))
+    return (data,)
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * "\n" + "Solutions for", filename)
-        with open(filename) as f:
-            data = dict(read_map(f))
+        args = load_input(filename)
 
-        pt1 = solve_pt1(data)
+        pt1 = solve_pt1(*args)
         print("Part 1:", pt1)
 
-        pt2 = solve_pt2(data)
+        pt2 = solve_pt2(*args)
         print("Part 2:", pt2)
 
 
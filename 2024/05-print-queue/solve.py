@@ -4,6 +4,7 @@ Advent of Code 2024
 `Day 5 <https://adventofcode.com/2024/day/5>`_:
 Print Queue
 """
+import itertools
 import os
 import sys
 
@@ -33,17 +34,6 @@ def read_input(f):
     return rules, updates
 
 
-class _Key(object):
-
-    def __init__(self, after, value):
-        self.after = after
-        self.value = value
-
-    def __lt__(self, other):
-        return (self.value in self.after
-                and other.value in self.after[self.value])
-
-
 class RuleSet(object):
     """ a set of rules to sort a sequence """
 
@@ -54,12 +44,87 @@ class RuleSet(object):
                 self._after[a].add(b)
             else:
                 self._after[a] = set((b,))
-
-    def _keyfunc(self, value):
-        return _Key(self._after, value)
+        self._global_rank = None
+
+    def _get_ranks(self, pages):
+        """
+        get topological ranks of *pages*, using only rules between them.
+
+        Pages get the rank of the first layer they're in, when repeatedly
+        removing pages with nothing before them.
+
+        :raises ValueError: if the rules between *pages* have a cycle
+        """
+        pages = set(pages)
+        after = {p: self._after.get(p, set()) & pages for p in pages}
+        before_count = dict.fromkeys(pages, 0)
+        for successors in after.values():
+            for page in successors:
+                before_count[page] += 1
+
+        ranks = {}
+        layer = [p for p in pages if not before_count[p]]
+        for rank in itertools.count():
+            if not layer:
+                break
+            next_layer = []
+            for page in layer:
+                ranks[page] = rank
+                for successor in after[page]:
+                    before_count[successor] -= 1
+                    if not before_count[successor]:
+                        next_layer.append(successor)
+            layer = next_layer
+
+        if len(ranks) != len(pages):
+            raise ValueError("cyclic rules for pages %r" % (sorted(pages),))
+        return ranks
+
+    def rank(self, pages):
+        """
+        get a mapping of page to rank, for sorting *pages*.
+
+        If all rules together have no cycles, a single global rank is
+        computed once and used for every set of pages.  Otherwise, ranks are
+        computed for each set of pages, using only the rules between them.
+        """
+        if self._global_rank is None:
+            try:
+                everything = set(self._after).union(*self._after.values())
+                self._global_rank = self._get_ranks(everything)
+            except ValueError:
+                self._global_rank = False
+        if self._global_rank:
+            return self._global_rank
+        return self._get_ranks(pages)
+
+    def is_ordered(self, sequence):
+        """ check that no rule is broken by the order of *sequence* """
+        get_after = self._after.get
+        seen = set()
+        for page in sequence:
+            if not seen.isdisjoint(get_after(page, ())):
+                return False
+            seen.add(page)
+        return True
 
     def sort(self, sequence):
-        return sorted(sequence, key=self._keyfunc)
+        """
+        sort *sequence* so that no rule is broken.
+
+        Pages are first sorted by how many of the other pages must come
+        after them, which is enough if the rules between the pages are
+        transitive, as in the puzzle input.  Otherwise, they're sorted by
+        rank().
+        """
+        pages = set(sequence)
+        counts = {page: len(pages.intersection(self._after.get(page, ())))
+                  for page in pages}
+        result = sorted(sequence, key=counts.__getitem__, reverse=True)
+        if self.is_ordered(result):
+            return result
+        ranks = self.rank(sequence)
+        return sorted(sequence, key=lambda page: ranks.get(page, 0))
 
 
 def get_middle(sequence):
@@ -68,40 +133,42 @@ def get_middle(sequence):
 
 
 def solve_pt1(ruleset, updates):
-    fixed_updates = (ruleset.sort(update) for update in updates)
     return sum(
-        get_middle(orig)
-        for orig, fixed in zip(updates, fixed_updates)
-        if orig == fixed
+        get_middle(update)
+        for update in updates
+        if ruleset.is_ordered(update)
     )
 
 
 def solve_pt2(ruleset, updates):
-    fixed_updates = (ruleset.sort(update) for update in updates)
     return sum(
-        get_middle(fixed)
-        for orig, fixed in zip(updates, fixed_updates)
-        if orig != fixed
+        get_middle(ruleset.sort(update))
+        for update in updates
+        if not ruleset.is_ordered(update)
     )
 
 
 default_input_file = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename) as f:
+        rules, updates = read_input(f)
+    return RuleSet(rules), updates
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * "\n" + "Solutions for", filename)
-        with open(filename) as f:
-            rules, updates = read_input(f)
-
-        ruleset = RuleSet(rules)
+        args = load_input(filename)
 
-        pt1 = solve_pt1(ruleset, updates)
+        pt1 = solve_pt1(*args)
         print("Part 1:", pt1)
 
-        pt2 = solve_pt2(ruleset, updates)
+        pt2 = solve_pt2(*args)
         print("Part 2:", pt2)
 
 
@@ -4,8 +4,12 @@ Advent of Code 2024
 `Day 6 <https://adventofcode.com/2024/day/6>`_:
 Guard Gallivant
 """
+import argparse
+import logging
+import multiprocessing
 import os
-import sys
+
+logger = logging.getLogger(__name__)
 
 _UP = (-1, 0)
 _DOWN = (1, 0)
@@ -71,44 +75,193 @@ def is_loop(start, layout):
     return False
 
 
+class JumpTable(object):
+    """
+    jumps from one turn point of the patrol path to the next.
+
+    For every open position and heading, the table has the state the guard
+    is in after walking up to the next block and turning, or None if the
+    guard walks off the map.
+    """
+
+    def __init__(self, layout):
+        self.layout = layout
+        self._jumps = {}
+        for head in NEXT_HEADING:
+            # fill in the cells closest to the edge we're heading for first,
+            # so that the next cell is always known
+            order = sorted(layout, key=lambda p: (-p[0] * head[0],
+                                                  -p[1] * head[1]))
+            for pos in order:
+                if layout[pos] != BLOCK:
+                    self._jumps[(pos, head)] = self._get_jump(pos, head)
+
+    def _get_jump(self, pos, head):
+        nextpos = (pos[0] + head[0], pos[1] + head[1])
+        if nextpos not in self.layout:
+            return None
+        if self.layout[nextpos] == BLOCK:
+            return (pos, NEXT_HEADING[head])
+        return self._jumps[(nextpos, head)]
+
+    def jump(self, state, block=None):
+        """
+        get the next turn point after *state*.
+
+        An extra *block* position can be given as an overlay, without
+        changing the table.
+        """
+        turn = self._jumps[state]
+        if block is None:
+            return turn
+        (row, col), head = state
+        ahead = (block[0] - row) * head[0] + (block[1] - col) * head[1]
+        aside = (block[0] - row) * head[1] - (block[1] - col) * head[0]
+        if ahead <= 0 or aside:
+            return turn
+        if turn is not None:
+            stop = turn[0]
+            if ahead > (stop[0] - row) * head[0] + (stop[1] - col) * head[1]:
+                return turn
+        return ((block[0] - head[0], block[1] - head[1]), NEXT_HEADING[head])
+
+    def is_loop(self, start, block=None):
+        """ check if the path from *start* is a loop, using turn points """
+        seen = set()
+        state = start
+        while state is not None:
+            if state in seen:
+                return True
+            seen.add(state)
+            state = self.jump(state, block)
+        return False
+
+
 def solve_pt1(start, layout):
     """ count number of visited positions before leaving the *layout* """
     return len(set(pos for pos, _ in walk(start, layout)))
 
 
-def solve_pt2(start, layout):
+def find_candidates(start, layout):
+    """
+    find positions where an extra block would change the patrol path.
+
+    Only positions on the original path matter.  Each is mapped to the
+    state right before the guard first reaches it, since the path up to
+    that state is the same with or without the extra block.
+    """
+    candidates = {}
+    prev = None
+    for state in walk(start, layout):
+        pos = state[0]
+        if layout[pos] == SPACE and pos not in candidates:
+            candidates[pos] = prev
+        prev = state
+    return candidates
+
+
+def pack_layout(layout):
+    """ pack *layout* into a compact, immutable (width, bytes) pair """
+    height = max(row for row, _ in layout) + 1
+    width = max(col for _, col in layout) + 1
+    cells = bytearray(SPACE.encode('ascii') * (height * width))
+    for (row, col), char in layout.items():
+        cells[row * width + col] = ord(char)
+    return width, bytes(cells)
+
+
+def unpack_layout(packed):
+    """ get a layout from :func:`pack_layout` """
+    width, cells = packed
+    return {(i // width, i % width): chr(c) for i, c in enumerate(cells)}
+
+
+# jump table for parallel workers, built once per worker process
+_worker_table = None
+
+
+def _init_worker(packed):
+    global _worker_table
+    _worker_table = JumpTable(unpack_layout(packed))
+
+
+def _count_loops(candidates):
+    """ count loops for a chunk of (block, state) candidates in a worker """
+    return sum(_worker_table.is_loop(state, block)
+               for block, state in candidates)
+
+
+def count_loops_parallel(layout, candidates, workers):
+    """
+    count loops for all *candidates* in a pool of *workers* processes.
+
+    Each worker gets its own compact copy of the *layout*, and checks each
+    candidate block as an overlay on an unchanged jump table.
+    """
+    items = list(candidates.items())
+    size = max(1, len(items) // (workers * 4))
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(pack_layout(layout),)) as pool:
+        return sum(pool.imap_unordered(_count_loops, chunks))
+
+
+def solve_pt2(start, layout, workers=1):
     """ count number of layouts with one extra block that creates a loop """
-    layout = dict(layout)
-    candidates = set(p for p, v in layout.items() if v == SPACE)
-    loops = 0
-    for pos in candidates:
-        oldval, layout[pos] = layout[pos], BLOCK
-        loops += is_loop(start, layout)
-        layout[pos] = oldval
-    return loops
+    candidates = find_candidates(start, layout)
+    spaces = sum(1 for v in layout.values() if v == SPACE)
+    logger.info("trying %d of %d positions, %d pruned",
+                len(candidates), spaces, spaces - len(candidates))
+
+    if workers > 1:
+        return count_loops_parallel(layout, candidates, workers)
+
+    table = JumpTable(layout)
+    return sum(table.is_loop(state, block)
+               for block, state in candidates.items())
 
 
 default_input_file = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
-def main():
-    files = sys.argv[1:] or [default_input_file]
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename) as f:
+        layout = dict(read_map(f))
 
-    for i, filename in enumerate(files):
-        print(bool(i) * "\n" + "Solutions for", filename)
-        with open(filename) as f:
-            layout = dict(read_map(f))
+    start = find_start(layout)
 
-        start = find_start(layout)
+    # input sanity check
+    if is_loop(start, layout):
+        raise RuntimeError("initial input path is a loop!")
 
-        # input sanity check
-        if is_loop(start, layout):
-            raise RuntimeError("initial input path is a loop!")
+    return start, layout
+
+
+def main(inargs=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '-w', '--workers',
+        metavar='N',
+        type=int,
+        default=1,
+        help="check part 2 obstructions in %(metavar)s worker processes")
+    parser.add_argument(
+        'files',
+        metavar='FILE',
+        nargs='*',
+        default=[default_input_file],
+        help="input files (default: input.txt)")
+    args = parser.parse_args(inargs)
+
+    for i, filename in enumerate(args.files):
+        print(bool(i) * "\n" + "Solutions for", filename)
+        start, layout = load_input(filename)
 
         pt1 = solve_pt1(start, layout)
         print("Part 1:", pt1)
 
-        pt2 = solve_pt2(start, layout)
+        pt2 = solve_pt2(start, layout, workers=args.workers)
         print("Part 2:", pt2)
 
 
@@ -25,17 +25,79 @@ def read_items(f):
                              % (lineno, line, e))
 
 
+def concatenate(a, b):
+    """ concatenate the digits of two integers, *a* and *b*. """
+    return a * (10 ** len(str(b))) + b
+
+
+def subtract(result, b):
+    """ undo ``a + b``, i.e. find *a* """
+    a = result - b
+    return a if a >= 0 else None
+
+
+# returned by an inverse when every value of *a* works
+ANY = object()
+
+
+def divide(result, b):
+    """ undo ``a * b``, i.e. find *a* """
+    if not b:
+        return ANY if not result else None
+    if not result % b:
+        return result // b
+    return None
+
+
+def split_suffix(result, b):
+    """ undo ``concatenate(a, b)``, i.e. find *a* """
+    scale = 10 ** len(str(b))
+    if result >= 0 and result % scale == b:
+        return result // scale
+    return None
+
+
+# inverse of each operator, as a function of (result, b) that returns a, or
+# None if there is no non-negative a where ``op(a, b) == result``, or ANY
+INVERSES = {
+    operator.add: subtract,
+    operator.mul: divide,
+    concatenate: split_suffix,
+}
+
+
 def get_solver(*operators):
-    """ get solver for a set of *operators*. """
+    """
+    get solver for a set of *operators*.
+
+    The solver works backwards from the answer, undoing the last operation
+    with each operator in turn.  Most branches end early, since an answer
+    must be divisible by the last operand to be a product, end with its
+    digits to be a concatenation, etc.  Operands must be non-negative, and
+    every operator must have an inverse in :data:`INVERSES`.
+    """
+    try:
+        inverses = tuple(INVERSES[fn] for fn in operators)
+    except KeyError as e:
+        raise ValueError("no inverse for operator %r" % (e.args[0],))
 
     def is_solvable(operands, answer):
         """ check if a solution exists for the *operands* and *answer* """
-        if len(operands) > 1:
-            return any(
-                is_solvable((fn(*operands[:2]),) + operands[2:], answer)
-                for fn in operators
-            )
-        return operands[0] == answer
+        pending = [(len(operands) - 1, answer)]
+        while pending:
+            i, result = pending.pop()
+            if not i:
+                if operands[0] == result:
+                    return True
+                continue
+            for inverse in inverses:
+                value = inverse(result, operands[i])
+                if value is ANY:
+                    # e.g. ``a * 0 == 0``, whatever the operands before it
+                    return True
+                if value is not None:
+                    pending.append((i - 1, value))
+        return False
 
     return is_solvable
 
@@ -49,11 +111,6 @@ def solve_pt1(data):
     )
 
 
-def concatenate(a, b):
-    """ concatenate the digits of two integers, *a* and *b*. """
-    return a * (10 ** len(str(b))) + b
-
-
 def solve_pt2(data):
     is_solvable = get_solver(operator.add, operator.mul, concatenate)
     return sum(
@@ -66,18 +123,24 @@ def solve_pt2(data):
 default_input_file = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename) as f:
+        data = list(read_items(f))
+    return (data,)
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * "\n" + "Solutions for", filename)
-        with open(filename) as f:
-            data = list(read_items(f))
+        args = load_input(filename)
 
-        pt1 = solve_pt1(data)
+        pt1 = solve_pt1(*args)
         print("Part 1:", pt1)
 
-        pt2 = solve_pt2(data)
+        pt2 = solve_pt2(*args)
         print("Part 2:", pt2)
 
 
@@ -0,0 +1,29 @@
+import operator
+
+import pytest
+
+import solve
+
+
+@pytest.mark.parametrize(
+    "operands, answer, expect",
+    (
+        ((10, 19), 190, True),
+        ((17, 8, 14), 192, False),
+        ((17, 0, 4, 20), 20, True),
+        ((0, 5), 0, True),
+        ((5, 0), 0, True),
+        ((5, 0), 5, True),
+        ((5, 0), 1, False),
+    ),
+)
+def test_is_solvable(operands, answer, expect):
+    is_solvable = solve.get_solver(operator.add, operator.mul)
+    assert is_solvable(operands, answer) == expect
+
+
+def test_is_solvable_concatenate():
+    is_solvable = solve.get_solver(operator.add, operator.mul, solve.concatenate)
+    assert is_solvable((17, 8, 14), 192)
+    assert is_solvable((1, 0), 10)
+    assert not is_solvable((1, 0), 11)
@@ -6,6 +6,7 @@ Resonant Collinearity
 """
 import collections
 import itertools
+import math
 import os
 import sys
 
@@ -22,67 +23,128 @@ def read_map(f):
 
 
 def get_antenna_pairs(antenna_map, ignore="."):
-    """ get pairs of antennas that share the same frequency. """
-    frequency_groups = collections.defaultdict(set)
+    """ get unordered pairs of antennas that share the same frequency. """
+    frequency_groups = collections.defaultdict(list)
     for point, freq in antenna_map.items():
         if freq in ignore:
             continue
-        frequency_groups[freq].add(point)
+        frequency_groups[freq].append(point)
 
     for points in frequency_groups.values():
-        if len(points) < 2:
-            continue
-        yield from itertools.permutations(points, 2)
-
+        yield from itertools.combinations(points, 2)
 
-def generate_antinodes(a, b):
-    """ find points in a line from *a*, in the opposite direction of *b*. """
-    delta = (a[0] - b[0], a[1] - b[1])
-    while True:
-        a = (a[0] + delta[0], a[1] + delta[1])
-        yield a
 
+def get_bounds(antenna_map):
+    """ get the (height, width) of the *antenna_map* """
+    height = max((row for row, _ in antenna_map), default=-1) + 1
+    width = max((col for _, col in antenna_map), default=-1) + 1
+    return height, width
 
-def get_next_antinodes(antenna_map):
-    """ get the next antinode for all antennas in the *antenna_map* """
-    for a, b in get_antenna_pairs(antenna_map):
-        c = next(generate_antinodes(a, b))
-        if c in antenna_map:
-            yield c
 
+def get_step_range(point, step, bounds):
+    """
+    find the steps *k* where ``point + k * step`` is inside *bounds*.
 
-def get_all_antinodes(antenna_map):
-    """ get all antinodes in the *antenna_map* """
+    :returns tuple: the first and last step, or None if there are none
+    """
+    first, last = -math.inf, math.inf
+    for pos, delta, size in zip(point, step, bounds):
+        if not delta:
+            if not 0 <= pos < size:
+                return None
+            continue
+        # -pos <= k * delta <= size - 1 - pos, solved for k
+        low, high = -pos, size - 1 - pos
+        if delta < 0:
+            low, high = high, low
+        first = max(first, -(-low // delta))
+        last = min(last, high // delta)
+    if first > last:
+        return None
+    return first, last
+
+
+def mark_line(grid, point, step, first, last, width):
+    """
+    mark the points ``point + k * step`` in *grid*, for *first* <= k <=
+    *last*.
+
+    The *grid* is a bytearray with a byte per cell, at ``row * width +
+    col``, so the points are an extended slice of it.
+    """
+    start = (point[0] + first * step[0]) * width + point[1] + first * step[1]
+    stride = step[0] * width + step[1]
+    count = last - first + 1
+    stop = start + stride * (count - 1)
+    if stride < 0:
+        start, stop, stride = stop, start, -stride
+    grid[start:stop + 1:stride] = b"\1" * count
+
+
+def find_antinodes(antenna_map, harmonics=False, lattice=False):
+    """
+    find antinodes for all antenna pairs in *antenna_map*.
+
+    Antinodes are points on the line through a pair of antennas *a* and
+    *b*, at ``a + k * (b - a)``.  Without *harmonics*, only the two points
+    at k = -1 and k = 2 count, otherwise all points on the line within the
+    map.  With *lattice*, the step is reduced by its gcd, so that all grid
+    points on the line count.  This only applies to *harmonics*.
+
+    :returns bytearray: a grid with 1 for antinodes, see mark_line()
+    :raises ValueError: for *lattice* without *harmonics*
+    """
+    if lattice and not harmonics:
+        raise ValueError("lattice requires harmonics")
+    bounds = get_bounds(antenna_map)
+    width = bounds[1]
+    grid = bytearray(bounds[0] * width)
     for a, b in get_antenna_pairs(antenna_map):
-        antinodes = generate_antinodes(a, b)
-        while a in antenna_map:
-            yield a
-            a = next(antinodes)
+        step = (b[0] - a[0], b[1] - a[1])
+        if lattice:
+            divisor = math.gcd(*step)
+            step = (step[0] // divisor, step[1] // divisor)
+        steps = get_step_range(a, step, bounds)
+        if steps is None:
+            continue
+        if harmonics:
+            mark_line(grid, a, step, *steps, width)
+            continue
+        for k in (-1, 2):
+            if steps[0] <= k <= steps[1]:
+                mark_line(grid, a, step, k, k, width)
+    return grid
 
 
 def solve_pt1(antenna_map):
-    return len(set(get_next_antinodes(antenna_map)))
+    return find_antinodes(antenna_map).count(1)
 
 
 def solve_pt2(antenna_map):
-    return len(set(get_all_antinodes(antenna_map)))
+    return find_antinodes(antenna_map, harmonics=True).count(1)
 
 
 default_input_file = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename) as f:
+        antenna_map = dict(read_map(f))
+    return (antenna_map,)
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * "\n" + "Solutions for", filename)
-        with open(filename) as f:
-            antenna_map = dict(read_map(f))
+        args = load_input(filename)
 
-        pt1 = solve_pt1(antenna_map)
+        pt1 = solve_pt1(*args)
         print("Part 1:", pt1)
 
-        pt2 = solve_pt2(antenna_map)
+        pt2 = solve_pt2(*args)
         print("Part 2:", pt2)
 
 
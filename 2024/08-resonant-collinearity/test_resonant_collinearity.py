@@ -0,0 +1,44 @@
+import itertools
+import random
+
+import pytest
+
+import solve
+
+
+def _get_antenna_map(rows):
+    return dict(solve.read_map(rows))
+
+
+def _find_collinear(rows):
+    """ find all points in line with two antennas, by brute force """
+    antennas = {}
+    for row, line in enumerate(rows):
+        for col, char in enumerate(line):
+            if char != ".":
+                antennas.setdefault(char, []).append((row, col))
+    points = set()
+    for group in antennas.values():
+        for a, b in itertools.combinations(group, 2):
+            for row in range(len(rows)):
+                for col in range(len(rows[0])):
+                    if ((b[0] - a[0]) * (col - a[1])
+                            == (b[1] - a[1]) * (row - a[0])):
+                        points.add((row, col))
+    return points
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_find_antinodes_lattice(seed):
+    rng = random.Random(seed)
+    height, width = rng.randint(1, 12), rng.randint(1, 12)
+    rows = ["".join(rng.choice("....ab") for _ in range(width))
+            for _ in range(height)]
+    grid = solve.find_antinodes(_get_antenna_map(rows),
+                                harmonics=True, lattice=True)
+    assert grid.count(1) == len(_find_collinear(rows))
+
+
+def test_find_antinodes_lattice_needs_harmonics():
+    with pytest.raises(ValueError):
+        solve.find_antinodes(_get_antenna_map(["a.a"]), lattice=True)
@@ -4,6 +4,7 @@ Advent of Code 2024
 `Day 9 <https://adventofcode.com/2024/day/9>`_:
 Disk Fragmenter
 """
+import heapq
 import os
 import sys
 
@@ -13,70 +14,85 @@ def read_input(f):
     return [int(i) for i in f.readline().strip()]
 
 
-def checksum(iterable):
-    """ get checksum from an *iterable* of file blocks (block-id, file-id) """
-    return sum(block_id * file_id for block_id, file_id in iterable if file_id)
-
-
-def iter_blocks(disk_map, reverse=False):
-    """" get the content of each block on the disk. """
-    iterable = reversed(disk_map) if reverse else disk_map
-    node_id = len(disk_map) - 1 if reverse else 0
-    for size in iterable:
-        file_id = None if node_id % 2 else node_id // 2
-        for _ in range(size):
-            yield file_id
-        node_id += -1 if reverse else 1
+def checksum(runs):
+    """ get checksum from an iterable of file runs (start, length, file-id) """
+    # sum of block_id * file_id over each run, as an arithmetic series
+    return sum(file_id * (start * length + length * (length - 1) // 2)
+               for start, length, file_id in runs)
 
 
 def defrag_blocks(disk_map):
     """ move file blocks from the end into the first available space. """
-    blocks = iter_blocks(disk_map)
-    to_move = iter_blocks(disk_map, reverse=True)
-    file_blocks = sum(size for node_id, size in enumerate(disk_map)
-                      if not node_id % 2)
-    for block_id in range(0, file_blocks):
-        file_id = next(blocks)
-        while file_id is None:
-            file_id = next(to_move)
-        yield block_id, file_id
+    if not disk_map:
+        return
+    # the last file, and the number of its blocks that are not moved yet
+    right = len(disk_map) - 1 - (len(disk_map) - 1) % 2
+    remaining = disk_map[right]
+
+    block_id = 0
+    left = 0
+    while left < right:
+        size = disk_map[left]
+        if not left % 2:
+            yield block_id, size, left // 2
+            block_id += size
+        while left % 2 and size and left < right:
+            length = min(size, remaining)
+            yield block_id, length, right // 2
+            block_id += length
+            size -= length
+            remaining -= length
+            if not remaining:
+                right -= 2
+                remaining = disk_map[right]
+        left += 1
+
+    if left == right:
+        yield block_id, remaining, right // 2
 
 
 def solve_pt1(disk_map):
     return checksum(defrag_blocks(disk_map))
 
 
+# largest possible gap, a single digit in the disk map
+MAX_SIZE = 9
+
+
 def defrag_files(disk_map):
     """ move whole files from the end into the first available space. """
-    spaces = []
+    # start positions of the free spaces, in one heap per size
+    spaces = [[] for _ in range(MAX_SIZE + 1)]
     files = []
 
     block_id = 0
     for node_id, size in enumerate(disk_map):
         if node_id % 2:
-            spaces.append((block_id, size))
+            spaces[size].append(block_id)
         else:
             files.append((block_id, size, node_id // 2))
         block_id += size
+    for heap in spaces:
+        heapq.heapify(heap)
 
     def reserve_blocks(block_id, size):
         """ reserve blocks for a file at *block_id* of *size*. """
-        for idx, (next_id, next_size) in enumerate(spaces):
-            if next_id > block_id:
-                break
-            if next_size < size:
-                continue
-            if next_size > size:
-                spaces[idx] = (next_id + size, next_size - size)
-            else:
-                spaces.pop(idx)
-            return next_id
-        return block_id
+        # the leftmost space that fits is one of the heap tops
+        best_id, best_size = block_id, None
+        for next_size in range(size, MAX_SIZE + 1):
+            heap = spaces[next_size]
+            if heap and heap[0] < best_id:
+                best_id, best_size = heap[0], next_size
+        if best_size is None:
+            return block_id
+
+        heapq.heappop(spaces[best_size])
+        if best_size > size:
+            heapq.heappush(spaces[best_size - size], best_id + size)
+        return best_id
 
     for block_id, size, file_id in reversed(files):
-        block_id = reserve_blocks(block_id, size)
-        for i in range(size):
-            yield block_id + i, file_id
+        yield reserve_blocks(block_id, size), size, file_id
 
 
 def solve_pt2(disk_map):
@@ -86,18 +102,24 @@ def solve_pt2(disk_map):
 default_input_file = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename) as f:
+        data = read_input(f)
+    return (data,)
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * "\n" + "Solutions for", filename)
-        with open(filename) as f:
-            data = read_input(f)
+        args = load_input(filename)
 
-        pt1 = solve_pt1(data)
+        pt1 = solve_pt1(*args)
         print("Part 1:", pt1)
 
-        pt2 = solve_pt2(data)
+        pt2 = solve_pt2(*args)
         print("Part 2:", pt2)
 
 
@@ -7,86 +7,143 @@ Hoof It
 import os
 import sys
 
-DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
 MIN_HEIGHT = 0
 MAX_HEIGHT = 9
 
+# cell value for positions without a height, and around the map
+NO_HEIGHT = 0xff
+# cell value for characters that aren't a height or "."
+_INVALID = 0xfe
+
+# translation table from input characters to cell values
+_HEIGHTS = bytes(
+    c - ord("0") if ord("0") <= c <= ord("9")
+    else NO_HEIGHT if c == ord(".")
+    else _INVALID
+    for c in range(256))
+
 
 def read_map(f):
-    """ read position and height pairs from file-like *f*. """
-    rownum = 0
+    """
+    read heights from binary file-like *f*, into a flat grid.
+
+    Cells are stored one byte per position, at ``(row + 1) * stride +
+    col``.  There is a row of NO_HEIGHT cells above and below the map, and
+    a column of them at the end of each row, so that every neighbour of a
+    cell on the map is a valid index.
+
+    :returns tuple: the cells, and the stride between rows
+    """
+    rows = []
     for lineno, raw_line in enumerate(f, 1):
         line = raw_line.strip()
         if not line:
             continue
-        for colnum, char in enumerate(line):
-            if char == ".":
-                continue  # example file support
-            try:
-                yield ((rownum, colnum), int(char))
-            except ValueError:
-                raise ValueError("invalid input on line %d (%r): %r"
-                                 % (lineno, raw_line, char))
-        rownum += 1
-
-
-def find_trailheads(topography):
-    """ find all trailheads in a given *topography*. """
-    heads = set(p for p in topography if topography[p] == MIN_HEIGHT)
+        row = line.translate(_HEIGHTS)
+        if _INVALID in row:
+            char = line[row.index(_INVALID):][:1]
+            raise ValueError("invalid input on line %d (%r): %r"
+                             % (lineno, raw_line.decode(errors="replace"),
+                                char.decode(errors="replace")))
+        rows.append(row)
+
+    stride = max(map(len, rows), default=0) + 1
+    cells = bytearray([NO_HEIGHT]) * (stride * (len(rows) + 2))
+    for rownum, row in enumerate(rows, 1):
+        start = rownum * stride
+        cells[start:start + len(row)] = row
+    return cells, stride
+
+
+def find_trailheads(cells):
+    """ find the cell indices of all trailheads in *cells*. """
+    heads = [i for i, height in enumerate(cells) if height == MIN_HEIGHT]
     if not heads:
         raise RuntimeError("no trailheads in topography")
     return heads
 
 
-def get_valid_steps(topography, currpos):
-    """ find valid next steps from *currpos* in *topography* """
-    next_height = topography[currpos] + 1
-    neighbors = ((currpos[0] + d[0], currpos[1] + d[1]) for d in DIRECTIONS)
-    return (n for n in neighbors if topography.get(n, -1) == next_height)
+def get_valid_steps(cells, stride, index):
+    """ find valid next steps from cell *index* """
+    next_height = cells[index] + 1
+    return (n for n in (index - stride, index + 1, index + stride, index - 1)
+            if cells[n] == next_height)
+
+
+def propagate(cells, stride, summit_value, merge):
+    """
+    propagate values from each summit down the trails in *cells*.
 
+    Cells are processed one height at a time, from *MAX_HEIGHT* down, so
+    that all valid next steps from a cell already have a value.  Summits get
+    ``summit_value(index)``, and every other cell gets the *merge* of the
+    values of its valid next steps.
 
-def find_paths(topography, path):
-    """ find all paths in *topography* that leads to a *MAX_HEIGHT*. """
-    currpos = path[-1]
-    if topography[currpos] == MAX_HEIGHT:
-        yield path
-    else:
-        for nextpos in get_valid_steps(topography, currpos):
-            yield from find_paths(topography, path + (nextpos,))
+    :returns list: values by cell index, None for cells without a height
+    """
+    levels = [[] for _ in range(MAX_HEIGHT + 1)]
+    for index, height in enumerate(cells):
+        if height <= MAX_HEIGHT:
+            levels[height].append(index)
 
+    values = [None] * len(cells)
+    for index in levels[MAX_HEIGHT]:
+        values[index] = summit_value(index)
+    for level in reversed(levels[:MAX_HEIGHT]):
+        for index in level:
+            values[index] = merge(values[n] for n in
+                                  get_valid_steps(cells, stride, index))
+    return values
 
-def solve_pt1(topography):
-    """ find the sum of all trail scores in *topography* """
-    return sum(
-        len(set(path[-1] for path in find_paths(topography, (trailhead,))))
-        for trailhead in find_trailheads(topography)
-    )
 
+def merge_bits(bitsets):
+    """ get the union of integer *bitsets* """
+    union = 0
+    for bits in bitsets:
+        union |= bits
+    return union
 
-def solve_pt2(topography):
-    """ find the sum of all trail ratings in *topography* """
-    return sum(
-        1
-        for trailhead in find_trailheads(topography)
-        for _ in find_paths(topography, (trailhead,))
-    )
+
+def solve_pt1(cells, stride):
+    """ find the sum of all trail scores in *cells* """
+    # reachable summits from each cell, as a bitset of summit numbers
+    summits = {}
+    reachable = propagate(
+        cells, stride,
+        lambda index: 1 << summits.setdefault(index, len(summits)),
+        merge_bits)
+    return sum(bin(reachable[trailhead]).count("1")
+               for trailhead in find_trailheads(cells))
+
+
+def solve_pt2(cells, stride):
+    """ find the sum of all trail ratings in *cells* """
+    # number of distinct trails from each cell to any summit
+    ratings = propagate(cells, stride, lambda index: 1, sum)
+    return sum(ratings[trailhead] for trailhead in find_trailheads(cells))
 
 
 default_input_file = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename, "rb") as f:
+        cells, stride = read_map(f)
+    return cells, stride
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * "\n" + "Solutions for", filename)
-        with open(filename) as f:
-            topography = dict(read_map(f))
+        args = load_input(filename)
 
-        pt1 = solve_pt1(topography)
+        pt1 = solve_pt1(*args)
         print("Part 1:", pt1)
 
-        pt2 = solve_pt2(topography)
+        pt2 = solve_pt2(*args)
         print("Part 2:", pt2)
 
 
@@ -4,11 +4,15 @@ Advent of Code 2024
 `Day 11 <https://adventofcode.com/2024/day/11>`_:
 Plutonian Pebbles
 """
+import bisect
 import collections
 import functools
+import logging
 import os
 import sys
 
+logger = logging.getLogger(__name__)
+
 
 def read_input(f):
     """ read the numbers from a file-like *f*. """
@@ -20,13 +24,25 @@ def read_input(f):
             raise ValueError("invalid input on line %d: %s" % (lineno, e))
 
 
+# powers of ten, extended as needed by count_digits()
+POWERS_OF_TEN = [1]
+
+
+def count_digits(value):
+    """ count the decimal digits of a non-negative integer *value* """
+    while POWERS_OF_TEN[-1] <= value:
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    return max(1, bisect.bisect_right(POWERS_OF_TEN, value))
+
+
+@functools.cache
 def change_stone(value):
     """ get new stone engraving(s) for a given engraving *value* """
     if value == 0:
         return (1,)
-    digits = len(str(value))
+    digits = count_digits(value)
     if digits % 2 == 0:
-        factor = 10 ** (digits // 2)
+        factor = POWERS_OF_TEN[digits // 2]
         return (value // factor, value % factor)
     return (value * 2024,)
 
@@ -40,12 +56,41 @@ def next_stone_count(oldcount):
     return newcount
 
 
-def solve(stones, blinks):
-    """ get number of stones after *limit* blinks """
+BlinkStats = collections.namedtuple(
+    "BlinkStats", ("blink", "distinct", "stones", "hits", "misses"))
+
+
+def iter_blinks(stones, blinks):
+    """
+    blink *blinks* times, and yield :class:`BlinkStats` after each blink.
+
+    The stats have the number of distinct engravings and stones, and the
+    hits and misses in the :func:`change_stone` cache during the blink.  The
+    cache is kept between calls, so later inputs reuse transitions that are
+    already known.
+    """
     stone_count = collections.Counter(stones)
-    for _ in range(blinks):
+    info = change_stone.cache_info()
+    for blink in range(1, blinks + 1):
         stone_count = next_stone_count(stone_count)
-    return sum(stone_count.values())
+        prev, info = info, change_stone.cache_info()
+        yield BlinkStats(blink, len(stone_count), sum(stone_count.values()),
+                         info.hits - prev.hits, info.misses - prev.misses)
+
+
+def solve(stones, blinks):
+    """ get number of stones after *blinks* blinks """
+    stats = None
+    for stats in iter_blinks(stones, blinks):
+        logger.debug("blink %d: %d distinct, %d hits, %d misses",
+                     stats.blink, stats.distinct, stats.hits, stats.misses)
+    if stats is None:
+        return len(stones)
+    info = change_stone.cache_info()
+    logger.info("%d blinks: %d distinct engravings, cache hit rate %.1f%%",
+                blinks, stats.distinct,
+                100 * info.hits / ((info.hits + info.misses) or 1))
+    return stats.stones
 
 
 solve_pt1 = functools.partial(solve, blinks=25)
@@ -55,18 +100,24 @@ solve_pt2 = functools.partial(solve, blinks=75)
 default_input_file = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
+def load_input(filename):
+    """ read solver arguments from *filename* """
+    with open(filename) as f:
+        stones = list(read_input(f))
+    return (stones,)
+
+
 def main():
     files = sys.argv[1:] or [default_input_file]
 
     for i, filename in enumerate(files):
         print(bool(i) * "\n" + "Solutions for", filename)
-        with open(filename) as f:
-            stones = list(read_input(f))
+        args = load_input(filename)
 
-        pt1 = solve_pt1(stones)
+        pt1 = solve_pt1(*args)
         print("Part 1:", pt1)
 
-        pt2 = solve_pt2(stones)
+        pt2 = solve_pt2(*args)
         print("Part 2:", pt2)
 
 
@@ -0,0 +1,7 @@
+"""
+Advent of Code tooling
+
+Shared utilities for running, verifying and timing the solutions in this
+repository.  The solutions themselves stay self-contained scripts; this
+package only imports them.
+"""
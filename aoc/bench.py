@@ -0,0 +1,241 @@
+"""
+Benchmark solutions.
+
+Times parsing and each part separately for every day, using the day's
+``input.txt``.  Each phase is run a number of times after a warmup, and the
+best and median times are kept.
+
+Results can be saved as a baseline, and later runs compared to it:
+
+::
+
+    python -m aoc.bench --save 2024
+    python -m aoc.bench --threshold 0.1 2024/06
+
+The exit status is non-zero if any phase is slower than the baseline by more
+than the threshold.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+
+from .cache import InputCache
+from .days import PARTS, ROOT, Timer, find_days
+from .run import format_time
+
+DEFAULT_BASELINE = os.path.join(ROOT, 'benchmark.json')
+
+# relative slowdown that counts as a regression
+DEFAULT_THRESHOLD = 0.2
+
+# ignore regressions in phases faster than this (noise)
+DEFAULT_MIN_TIME = 0.001
+
+
+def get_phases(day):
+    """ get phase names for a *day*. """
+    if day.has_phases:
+        return ('parse',) + tuple('part %d' % part for part in PARTS)
+    return ('main',)
+
+
+def time_phases(day, filename, cache=None):
+    """ run all phases of *day* once, and return a phase to time mapping. """
+    timings = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not day.has_phases:
+            with Timer() as t:
+                day.run_main(filename)
+            timings['main'] = t.elapsed
+            return timings
+
+        with Timer() as t:
+            if cache:
+                args = cache.load_input(day, filename)
+            else:
+                args = day.load_input(filename)
+        timings['parse'] = t.elapsed
+        for part in PARTS:
+            with Timer() as t:
+                day.solve(part, args)
+            timings['part %d' % part] = t.elapsed
+    return timings
+
+
+def bench_day(day, repeat, warmup, cache=None):
+    """
+    benchmark a *day* against its default input.
+
+    If an input *cache* is given, the parse phase is the time it takes to
+    load the input from the cache.
+
+    :returns dict:
+        a mapping of phase name to stats (min, median, times)
+    """
+    filename = day.get_input()
+    for _ in range(warmup):
+        time_phases(day, filename, cache=cache)
+
+    samples = {phase: [] for phase in get_phases(day)}
+    for _ in range(repeat):
+        for phase, elapsed in time_phases(day, filename, cache=cache).items():
+            samples[phase].append(elapsed)
+
+    return {
+        phase: {
+            'min': min(times),
+            'median': statistics.median(times),
+            'times': times,
+        }
+        for phase, times in samples.items()
+    }
+
+
+def compare(baseline, results, threshold=DEFAULT_THRESHOLD,
+            min_time=DEFAULT_MIN_TIME):
+    """
+    compare benchmark *results* to a *baseline*.
+
+    :returns list:
+        tuples of (day, phase, baseline time, new time) for every phase that
+        is more than *threshold* slower than its baseline.
+    """
+    regressions = []
+    for name, phases in sorted(results.items()):
+        for phase, stats in phases.items():
+            try:
+                old = baseline[name][phase]['min']
+            except KeyError:
+                continue
+            new = stats['min']
+            if new < min_time:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append((name, phase, old, new))
+    return regressions
+
+
+def read_baseline(filename):
+    with open(filename) as f:
+        return json.load(f)['days']
+
+
+def write_baseline(filename, results, repeat, warmup):
+    data = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'warmup': warmup,
+        'days': results,
+    }
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+TABLE_FORMAT = '{:<36} {:<8} {:>9} {:>9} {:>9}  {}'
+
+
+def format_row(name, phase, stats, old=None):
+    change = ''
+    if old is not None and old > 0:
+        change = '%+.1f%%' % (100 * (stats['min'] - old) / old)
+    return TABLE_FORMAT.format(
+        name, phase,
+        format_time(stats['min']),
+        format_time(stats['median']),
+        format_time(old),
+        change,
+    )
+
+
+def main(inargs=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark solutions against their input.txt")
+    parser.add_argument(
+        '-r', '--repeat',
+        type=int,
+        default=3,
+        help="number of timed runs per day (default: %(default)s)")
+    parser.add_argument(
+        '-w', '--warmup',
+        type=int,
+        default=1,
+        help="number of untimed runs per day (default: %(default)s)")
+    parser.add_argument(
+        '-b', '--baseline',
+        default=DEFAULT_BASELINE,
+        help="baseline file (default: %(default)s)")
+    parser.add_argument(
+        '-s', '--save',
+        action='store_true',
+        default=False,
+        help="save results to the baseline file")
+    parser.add_argument(
+        '-c', '--cache',
+        action='store_true',
+        default=False,
+        help="load parsed inputs from cache")
+    parser.add_argument(
+        '-t', '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown, as a fraction (default: %(default)s)")
+    parser.add_argument(
+        '--min-time',
+        type=float,
+        default=DEFAULT_MIN_TIME,
+        help="ignore phases faster than this, in seconds "
+             "(default: %(default)s)")
+    parser.add_argument(
+        'patterns',
+        metavar='DAY',
+        nargs='*',
+        help="only benchmark days matching these patterns, e.g. '2024/06'")
+    args = parser.parse_args(inargs)
+
+    if args.repeat < 1:
+        parser.error('invalid --repeat: must be at least 1')
+
+    days = find_days(patterns=args.patterns)
+    if not days:
+        parser.error('no matching days')
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        baseline = read_baseline(args.baseline)
+
+    cache = InputCache() if args.cache else None
+    results = {}
+    print(TABLE_FORMAT.format('day', 'phase', 'min', 'median', 'baseline',
+                              'change'))
+    for day in days:
+        stats = bench_day(day, args.repeat, args.warmup, cache=cache)
+        results[day.name] = stats
+        for phase, phase_stats in stats.items():
+            old = baseline.get(day.name, {}).get(phase, {}).get('min')
+            print(format_row(day.name, phase, phase_stats, old))
+            sys.stdout.flush()
+
+    regressions = compare(baseline, results, threshold=args.threshold,
+                          min_time=args.min_time)
+    for name, phase, old, new in regressions:
+        print('regression: %s %s: %s -> %s'
+              % (name, phase, format_time(old), format_time(new)),
+              file=sys.stderr)
+
+    if args.save:
+        baseline.update(results)
+        write_baseline(args.baseline, baseline, args.repeat, args.warmup)
+        print('\nbaseline written to', args.baseline)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Cache for parsed inputs.
+
+Stores the solver arguments returned by a day's ``load_input(filename)`` as
+pickles, keyed by:
+
+- a hash of the input file content
+- a hash of the parser source: ``load_input`` and every function, class and
+  constant from the day module that it (transitively) refers to.
+
+A change to either the input or the parser gives a new key, so stale entries
+are never used.  Use :meth:`InputCache.prune` to remove them.
+
+Solver arguments that can't be pickled (e.g. closures) are not cached.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import tempfile
+import types
+
+from .days import ROOT
+
+DEFAULT_CACHE_DIR = os.environ.get('AOC_CACHE_DIR',
+                                   os.path.join(ROOT, '.cache', 'aoc'))
+
+CACHE_SUFFIX = '.pickle'
+
+
+def hash_file(filename):
+    """ get a hex digest of the content of *filename*. """
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _iter_names(code):
+    """ iterate over global names used by *code* and nested code objects. """
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _iter_names(const)
+
+
+def _describe(value):
+    """ get a stable description of a constant *value*. """
+    if isinstance(value, (set, frozenset)):
+        return repr(sorted(repr(v) for v in value))
+    return repr(value)
+
+
+def get_dependencies(module, obj):
+    """
+    find all module level objects that *obj* depends on.
+
+    :returns dict:
+        a mapping of name to object, including *obj* itself.
+    """
+    found = {obj.__name__: obj}
+    todo = [obj]
+    while todo:
+        current = todo.pop()
+        if isinstance(current, type):
+            codes = [v.__code__ for v in vars(current).values()
+                     if hasattr(v, '__code__')]
+        elif hasattr(current, '__code__'):
+            codes = [current.__code__]
+        else:
+            codes = []
+        for name in (n for code in codes for n in _iter_names(code)):
+            if (name in found or name not in vars(module)
+                    or name.startswith('__')):
+                continue
+            value = vars(module)[name]
+            if isinstance(value, types.ModuleType):
+                continue
+            if (callable(value)
+                    and getattr(value, '__module__', None) != module.__name__):
+                # imported from elsewhere
+                continue
+            found[name] = value
+            todo.append(value)
+    return found
+
+
+def hash_parser(module, func_name='load_input'):
+    """ get a hex digest of the source of a parser and its dependencies. """
+    digest = hashlib.sha256()
+    deps = get_dependencies(module, getattr(module, func_name))
+    for name, value in sorted(deps.items()):
+        if isinstance(value, type) or inspect.isfunction(value):
+            source = inspect.getsource(value)
+        else:
+            source = _describe(value)
+        digest.update(('%s\n%s\n' % (name, source)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class InputCache(object):
+    """ a directory of cached solver arguments. """
+
+    def __init__(self, path=DEFAULT_CACHE_DIR):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._parser_hashes = {}
+
+    def __repr__(self):
+        return '<InputCache %s>' % (self.path,)
+
+    def _get_dir(self, day):
+        return os.path.join(self.path, re.sub(r'\W', '_', day.name))
+
+    def _hash_parser(self, day):
+        if day.module_file not in self._parser_hashes:
+            self._parser_hashes[day.module_file] = hash_parser(day.module)
+        return self._parser_hashes[day.module_file]
+
+    def get_filename(self, day, filename):
+        """ get the cache file for input *filename* of *day*. """
+        key = '%s-%s' % (hash_file(filename)[:32],
+                         self._hash_parser(day)[:32])
+        return os.path.join(self._get_dir(day), key + CACHE_SUFFIX)
+
+    def load_input(self, day, filename):
+        """ get solver arguments for *filename*, parsing it if needed. """
+        cache_file = self.get_filename(day, filename)
+        try:
+            with open(cache_file, 'rb') as f:
+                args = pickle.load(f)
+            self.hits += 1
+            return args
+        except FileNotFoundError:
+            pass
+
+        self.misses += 1
+        args = day.load_input(filename)
+        self.store(cache_file, args)
+        return args
+
+    def store(self, cache_file, args):
+        """ store solver *args* in *cache_file*, if they can be pickled. """
+        try:
+            data = pickle.dumps(args, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(cache_file),
+                                   suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, cache_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return True
+
+    def prune(self, day):
+        """ remove cache entries for *day* made with an outdated parser. """
+        current = '-' + self._hash_parser(day)[:32] + CACHE_SUFFIX
+        dirname = self._get_dir(day)
+        if not os.path.isdir(dirname):
+            return 0
+        removed = 0
+        for name in os.listdir(dirname):
+            if not name.endswith(current):
+                os.unlink(os.path.join(dirname, name))
+                removed += 1
+        return removed
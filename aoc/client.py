@@ -0,0 +1,93 @@
+"""
+Client for the solver daemon.
+
+Sends input files to a running :mod:`aoc.daemon`, and prints the solutions
+with the same output as the day's own ``solve.py``:
+
+::
+
+    python -m aoc.client 2024/06 example.txt input.txt
+    python -m aoc.client --part 2 --time 2024/06
+
+This module is kept free of heavy imports, so that it starts fast.
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+
+
+def get_default_socket():
+    """ get the default socket path for the current user. """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'aoc.sock')
+    return os.path.join('/tmp', 'aoc-%d.sock' % os.getuid())
+
+
+DEFAULT_SOCKET = os.environ.get('AOC_SOCKET') or get_default_socket()
+
+
+def send_request(path, request):
+    """ send a *request* to the daemon at *path*, and return the response. """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    if not line:
+        raise RuntimeError('no response from daemon')
+    return json.loads(line)
+
+
+def main(inargs=None):
+    parser = argparse.ArgumentParser(
+        description="Solve a day using a running solver daemon")
+    parser.add_argument(
+        '-s', '--socket',
+        default=DEFAULT_SOCKET,
+        help="daemon socket (default: %(default)s)")
+    parser.add_argument(
+        '--part',
+        type=int,
+        choices=(1, 2),
+        help="only solve this part")
+    parser.add_argument(
+        '-t', '--time',
+        action='store_true',
+        default=False,
+        help="show timings from the daemon on stderr")
+    parser.add_argument(
+        'day',
+        metavar='DAY',
+        help="day to solve, e.g. '2024/06'")
+    parser.add_argument(
+        'files',
+        metavar='FILE',
+        nargs='*',
+        help="input files (default: input.txt)")
+    args = parser.parse_args(inargs)
+
+    files = args.files or [None]
+    for i, filename in enumerate(files):
+        request = {'day': args.day, 'part': args.part}
+        if filename is not None:
+            request['input'] = (os.path.abspath(filename)
+                                if os.path.exists(filename) else filename)
+        response = send_request(args.socket, request)
+        if 'error' in response:
+            print('error:', response['error'], file=sys.stderr)
+            return 1
+
+        print(bool(i) * "\n" + "Solutions for", filename or response['input'])
+        print("\n".join(response['lines']))
+        sys.stdout.flush()
+        if args.time:
+            timings = ('%s: %.3fs' % tuple(t) for t in response['timings'])
+            print(', '.join(timings), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
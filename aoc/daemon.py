@@ -0,0 +1,147 @@
+"""
+Solver daemon.
+
+A long-running process that keeps every day module imported, and solves
+inputs on request over a unix socket.  This avoids the interpreter startup
+and import time of running ``python solve.py`` for each input.
+
+::
+
+    python -m aoc.daemon &
+    python -m aoc.client 2024/06 input.txt
+
+Each request is handled in a forked child process, so requests can run in
+parallel, and can't change the state of the daemon.
+
+The protocol is one JSON object per line.  A request has:
+
+``day``
+    a day name pattern (e.g. ``'2024/06'``), or a day number along with a
+    ``year``
+``part``
+    the part to solve (1 or 2), or null to solve all parts
+``input``
+    path to the input file, either absolute or relative to the day
+    directory (default: ``input.txt``)
+
+The response has the output ``lines`` of the solution, the resolved
+``input`` path, and ``timings`` as a list of ``[phase, seconds]`` pairs, or
+an ``error`` message.
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+
+from .client import DEFAULT_SOCKET
+from .days import PARTS, Timer, find_days
+from .solve import format_answer
+
+
+class DayIndex(object):
+    """ imported day modules, by name. """
+
+    def __init__(self, days):
+        self.days = {day.name: day for day in days if day.has_phases}
+
+    def get(self, request):
+        """ find the day from a *request*. """
+        if 'year' in request:
+            pattern = '%d/%02d-' % (int(request['year']), int(request['day']))
+        else:
+            pattern = str(request['day']).rstrip('/')
+        matches = [day for name, day in self.days.items()
+                   if name.startswith(pattern)]
+        if len(matches) != 1:
+            raise LookupError('%r matches %d days' % (pattern, len(matches)))
+        return matches[0]
+
+
+def solve_request(index, request):
+    """ solve a *request*, and return the response. """
+    day = index.get(request)
+    filename = day.get_input(request.get('input') or 'input.txt')
+    parts = PARTS if request.get('part') is None else (int(request['part']),)
+
+    timings = []
+    with Timer() as t:
+        args = day.load_input(filename)
+    timings.append(('parse', t.elapsed))
+
+    lines = []
+    for part in parts:
+        with Timer() as t:
+            answer = day.solve(part, args)
+        timings.append(('part %d' % part, t.elapsed))
+        lines.append(format_answer(part, answer))
+    return {'input': filename, 'lines': lines, 'timings': timings}
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            response = solve_request(self.server.index, request)
+        except Exception as e:
+            if self.server.verbose:
+                traceback.print_exc()
+            response = {'error': '%s: %s' % (type(e).__name__, e)}
+        self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+
+
+class SolverServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+
+    def __init__(self, path, index, verbose=False):
+        self.index = index
+        self.verbose = verbose
+        super().__init__(path, RequestHandler)
+
+
+def remove_stale_socket(path):
+    """ remove socket *path* if no daemon is listening on it. """
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)
+            return
+    raise RuntimeError('a daemon is already listening on %s' % (path,))
+
+
+def main(inargs=None):
+    parser = argparse.ArgumentParser(
+        description="Solver daemon, with all days imported")
+    parser.add_argument(
+        '-s', '--socket',
+        default=DEFAULT_SOCKET,
+        help="socket to listen on (default: %(default)s)")
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        default=False,
+        help="show tracebacks for failed requests")
+    args = parser.parse_args(inargs)
+
+    index = DayIndex(find_days())
+    remove_stale_socket(args.socket)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with SolverServer(args.socket, index, verbose=args.verbose) as server:
+        print('%d days loaded, listening on %s'
+              % (len(index.days), args.socket), file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(args.socket)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+"""
+Discover and load solutions.
+
+A *day* is a directory with a python solution module and a
+``solutions.txt`` file with known answers for one or more input files.
+
+Solution modules with a ``load_input(filename)`` function and
+``solve_pt1``/``solve_pt2`` functions can be run one phase at a time.  Older
+modules (e.g. ``2020/01-report/report.py``) only have a ``main()``, which is
+run as a whole with its output captured.
+"""
+import contextlib
+import fnmatch
+import importlib.util
+import io
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOLUTIONS_FILE = 'solutions.txt'
+DEFAULT_INPUT = 'input.txt'
+PARTS = (1, 2)
+
+RE_YEAR = re.compile(r"^(\d{4})")
+RE_HEADER = re.compile(r"^Solutions for (?P<filename>.+)$")
+RE_PART = re.compile(r"^Part (?P<part>\d+):(?: (?P<value>.*))?$")
+
+
+def read_solutions(f):
+    """
+    read answers from a solutions.txt file-like *f*.
+
+    :returns dict:
+        a mapping of input file name to a mapping of part number to answer.
+    """
+    solutions = {}
+    answers = None
+    part = None
+    for lineno, raw_line in enumerate(f, 1):
+        line = raw_line.rstrip("\n")
+        match = RE_HEADER.match(line)
+        if match:
+            filename = os.path.basename(match.group('filename'))
+            answers = solutions.setdefault(filename, {})
+            part = None
+            continue
+
+        if not line.strip():
+            part = None
+            continue
+
+        match = RE_PART.match(line)
+        if match:
+            if answers is None:
+                answers = solutions.setdefault(DEFAULT_INPUT, {})
+            part = int(match.group('part'))
+            answers[part] = match.group('value') or ''
+            continue
+
+        if part is not None:
+            # multi-line answer
+            answers[part] += bool(answers[part]) * "\n" + line
+            continue
+
+        raise ValueError("invalid solution on line %d (%r)"
+                         % (lineno, raw_line))
+    return solutions
+
+
+def find_module(path):
+    """ find the solution module in a day directory *path*. """
+    candidates = []
+    for name in sorted(os.listdir(path)):
+        if not name.endswith('.py') or name.startswith('test_'):
+            continue
+        filename = os.path.join(path, name)
+        with open(filename) as f:
+            source = f.read()
+        if 'default_input_file' in source and '\ndef main(' in source:
+            candidates.append(filename)
+
+    solve = os.path.join(path, 'solve.py')
+    if solve in candidates:
+        return solve
+    if len(candidates) == 1:
+        return candidates[0]
+    return None
+
+
+class Day(object):
+    """ a solution module and its known answers. """
+
+    def __init__(self, path, module_file):
+        self.path = path
+        self.module_file = module_file
+        self._module = None
+
+    @property
+    def name(self):
+        """ day name, e.g. '2024/06-guard-gallivant'. """
+        return os.path.relpath(self.path, ROOT).replace(os.sep, '/')
+
+    @property
+    def year(self):
+        return int(RE_YEAR.match(self.name).group(1))
+
+    def __repr__(self):
+        return '<Day %s>' % (self.name,)
+
+    def __getstate__(self):
+        # modules can't be pickled - workers load their own copy
+        state = dict(self.__dict__)
+        state['_module'] = None
+        return state
+
+    @property
+    def module(self):
+        if self._module is None:
+            mod_name = 'aoc_day_' + re.sub(r'\W', '_', self.name)
+            spec = importlib.util.spec_from_file_location(mod_name,
+                                                          self.module_file)
+            module = importlib.util.module_from_spec(spec)
+            # register the module, so that its objects can be pickled
+            sys.modules[mod_name] = module
+            spec.loader.exec_module(module)
+            self._module = module
+        return self._module
+
+    @property
+    def has_phases(self):
+        """ if the module can be run one phase (parse, part) at a time. """
+        return all(hasattr(self.module, attr)
+                   for attr in ('load_input', 'solve_pt1', 'solve_pt2'))
+
+    @property
+    def solutions(self):
+        with open(os.path.join(self.path, SOLUTIONS_FILE)) as f:
+            return read_solutions(f)
+
+    def get_input(self, filename=DEFAULT_INPUT):
+        return os.path.join(self.path, filename)
+
+    def load_input(self, filename):
+        """ parse *filename*, and return the solver arguments. """
+        return self.module.load_input(filename)
+
+    def solve(self, part, args):
+        """ solve *part* using solver arguments *args*. """
+        return getattr(self.module, 'solve_pt%d' % part)(*args)
+
+    def run_main(self, filename):
+        """ run the module main() on *filename*, and return its output. """
+        argv = sys.argv
+        buffer = io.StringIO()
+        try:
+            sys.argv = [self.module_file]
+            if filename != self.get_input():
+                sys.argv.append(filename)
+            with contextlib.redirect_stdout(buffer):
+                self.module.main()
+        finally:
+            sys.argv = argv
+        return buffer.getvalue()
+
+
+def find_days(root=ROOT, patterns=None):
+    """
+    find days with a solution module and known answers.
+
+    :param patterns:
+        only include days with names that matches one of these
+        shell-style patterns, e.g. '2024' or '2023/1?-*'.
+    """
+    days = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        if SOLUTIONS_FILE not in filenames:
+            continue
+        module_file = find_module(dirpath)
+        if not module_file:
+            continue
+        day = Day(dirpath, module_file)
+        if patterns and not any(fnmatch.fnmatch(day.name, p.rstrip('/') + '*')
+                                for p in patterns):
+            continue
+        days.append(day)
+    return days
+
+
+def is_correct(day, expected, answer):
+    """ check a given *answer* from *day* against the *expected* answer. """
+    if answer is None:
+        return False
+    if day.has_phases:
+        return str(answer) == expected
+    # main() output may include extra details, e.g. 'Part 1: 239 complete'
+    return answer == expected or expected in answer.split()
+
+
+class Timer(object):
+    """ context manager for timing a block of code. """
+
+    def __init__(self):
+        self.start = self.end = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.end = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        return (self.end or time.perf_counter()) - self.start
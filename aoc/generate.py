@@ -0,0 +1,366 @@
+"""
+Generate synthetic inputs.
+
+Each supported day has a generator that makes a valid input of a given
+*size*, so that solutions can be run on inputs larger (or smaller) than the
+puzzle input.  What the size means depends on the puzzle: the side of a
+grid, the number of lines, the length of a disk map, etc.
+
+::
+
+    python -m aoc.generate 2024/06 500 > big.txt
+    python -m aoc.generate --seed 1 --output reports.txt 2024/02 100000
+
+Generators are deterministic for a given seed.
+"""
+import argparse
+import collections
+import fnmatch
+import random
+import string
+import sys
+
+Generator = collections.namedtuple('Generator',
+                                   ('pattern', 'func', 'unit', 'base'))
+
+GENERATORS = []
+
+DEFAULT_SEED = 0
+
+
+def generator(pattern, unit, base):
+    """
+    register a generator function for days matching *pattern*.
+
+    :param str unit: what the size of the input means
+    :param int base: a size that solves quickly, for scaling tests
+    """
+    def decorator(func):
+        GENERATORS.append(Generator(pattern, func, unit, base))
+        return func
+    return decorator
+
+
+def find_generator(name):
+    """ find the generator for a day *name*, e.g. ``'2024/06-guard'``. """
+    for gen in GENERATORS:
+        if fnmatch.fnmatch(name, gen.pattern + '*'):
+            return gen
+    raise LookupError('no generator for %r' % (name,))
+
+
+def generate(name, size, seed=DEFAULT_SEED):
+    """ generate an input of *size* for the day *name*, as text. """
+    if size < 1:
+        raise ValueError('invalid size: %r' % (size,))
+    gen = find_generator(name)
+    rng = random.Random(seed)
+    return ''.join(line + '\n' for line in gen.func(rng, size))
+
+
+def random_grid(rng, size, weights):
+    """ make a *size* square grid, with cells chosen from *weights*. """
+    chars = list(weights)
+    cum_weights = []
+    total = 0
+    for char in chars:
+        total += weights[char]
+        cum_weights.append(total)
+    return [rng.choices(chars, cum_weights=cum_weights, k=size)
+            for _ in range(size)]
+
+
+#
+# 2022
+#
+
+# small primes, like the monkey divisors in the puzzle input
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23)
+
+
+@generator('2022/11', 'monkeys', 4)
+def gen_monkeys(rng, size):
+    size = max(size, 2)
+    squares = rng.randrange(size)
+    for monkey in range(size):
+        others = [m for m in range(size) if m != monkey]
+        items = [rng.randint(50, 99) for _ in range(rng.randint(1, 8))]
+        if monkey == squares:
+            operation = 'old * old'
+        else:
+            operation = 'old %s %d' % rng.choice((('+', rng.randint(1, 8)),
+                                                  ('*', rng.randint(2, 19))))
+        yield 'Monkey %d:' % monkey
+        yield '  Starting items: ' + ', '.join(str(i) for i in items)
+        yield '  Operation: new = ' + operation
+        yield '  Test: divisible by %d' % rng.choice(_PRIMES)
+        yield '    If true: throw to monkey %d' % rng.choice(others)
+        yield '    If false: throw to monkey %d' % rng.choice(others)
+        yield ''
+
+
+#
+# 2023
+#
+
+@generator('2023/11', 'grid side', 35)
+def gen_galaxies(rng, size):
+    grid = random_grid(rng, size, {'.': 30, '#': 1})
+    # puzzle inputs have a few rows and columns without galaxies
+    for row in rng.sample(range(size), size // 10):
+        grid[row] = ['.'] * size
+    for col in rng.sample(range(size), size // 10):
+        for row in grid:
+            row[col] = '.'
+    return (''.join(row) for row in grid)
+
+
+@generator('2023/12', 'records', 200)
+def gen_springs(rng, size):
+    for _ in range(size):
+        springs = [rng.choice('#.') for _ in range(rng.randint(4, 20))]
+        springs[rng.randrange(len(springs))] = '#'
+        groups = [len(g) for g in ''.join(springs).split('.') if g]
+        record = ''.join('?' if rng.random() < 0.4 else c for c in springs)
+        yield '%s %s' % (record, ','.join(str(g) for g in groups))
+
+
+@generator('2023/14', 'grid side', 15)
+def gen_reflector(rng, size):
+    grid = random_grid(rng, size, {'.': 13, 'O': 5, '#': 2})
+    return (''.join(row) for row in grid)
+
+
+#
+# 2024
+#
+
+@generator('2024/01', 'lines', 2000)
+def gen_location_ids(rng, size):
+    left = [rng.randint(10000, 99999) for _ in range(size)]
+    for value in left:
+        # some of the ids in the right list are also in the left list
+        if rng.random() < 0.3:
+            other = rng.choice(left)
+        else:
+            other = rng.randint(10000, 99999)
+        yield '%d   %d' % (value, other)
+
+
+@generator('2024/02', 'reports', 1000)
+def gen_reports(rng, size):
+    for _ in range(size):
+        sign = rng.choice((1, -1))
+        levels = [rng.randint(20, 70)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + sign * rng.randint(1, 3))
+        # about half of the reports get a bad level
+        if rng.random() < 0.5:
+            levels[rng.randrange(len(levels))] += rng.randint(-4, 4)
+        yield ' '.join(str(level) for level in levels)
+
+
+_MEMORY_NOISE = string.ascii_lowercase + string.punctuation + ' '
+
+
+@generator('2024/03', 'instructions', 2000)
+def gen_memory(rng, size):
+    tokens = []
+    for _ in range(size):
+        tokens.append(''.join(rng.choices(_MEMORY_NOISE, k=rng.randint(0, 8))))
+        if rng.random() < 0.05:
+            tokens.append(rng.choice(("do()", "don't()")))
+        else:
+            tokens.append('mul(%d,%d)' % (rng.randint(1, 999),
+                                          rng.randint(1, 999)))
+    text = ''.join(tokens)
+    # split into lines like the puzzle input, 3000ish characters each
+    for start in range(0, len(text), 3000):
+        yield text[start:start + 3000]
+
+
+@generator('2024/04', 'grid side', 35)
+def gen_word_search(rng, size):
+    grid = random_grid(rng, size, {'X': 1, 'M': 1, 'A': 1, 'S': 1})
+    return (''.join(row) for row in grid)
+
+
+@generator('2024/05', 'updates', 200)
+def gen_print_queue(rng, size):
+    pages = rng.sample(range(10, 100), 49)
+    for i, a in enumerate(pages):
+        for b in pages[i + 1:]:
+            yield '%d|%d' % (a, b)
+    yield ''
+    for _ in range(size):
+        update = rng.sample(pages, 2 * rng.randint(2, 11) + 1)
+        # about half of the updates are in order
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        yield ','.join(str(page) for page in update)
+
+
+def _guard_path_length(grid, row, col):
+    """
+    count moves and turns of the guard at *row*, *col* until it leaves *grid*.
+
+    :returns int: the path length, or None if the guard walks in a loop
+    """
+    size = len(grid)
+    dr, dc = -1, 0
+    seen = set()
+    while (row, col, dr, dc) not in seen:
+        seen.add((row, col, dr, dc))
+        r, c = row + dr, col + dc
+        if not (0 <= r < size and 0 <= c < size):
+            return len(seen)
+        if grid[r][c] == '#':
+            dr, dc = dc, -dr
+        else:
+            row, col = r, c
+    return None
+
+
+@generator('2024/06', 'grid side', 20)
+def gen_guard_map(rng, size):
+    # random guards tend to leave the map quickly, so pick the longest path
+    # out of a number of candidate maps
+    best, best_length = None, 0
+    for _ in range(100):
+        grid = random_grid(rng, size, {'.': 19, '#': 1})
+        row, col = rng.randrange(size), rng.randrange(size)
+        grid[row][col] = '^'
+        length = _guard_path_length(grid, row, col)
+        if length is not None and length > best_length:
+            best, best_length = grid, length
+        if best_length >= 2 * size:
+            break
+    if best is None:
+        best = [['.'] * size for _ in range(size)]
+        best[rng.randrange(size)][rng.randrange(size)] = '^'
+    return (''.join(row) for row in best)
+
+
+_OPERATORS = (
+    lambda a, b: a + b,
+    lambda a, b: a * b,
+    lambda a, b: int('%d%d' % (a, b)),
+)
+
+
+@generator('2024/07', 'equations', 25)
+def gen_equations(rng, size):
+    for _ in range(size):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        # a quarter can be made true without concatenation, and another
+        # quarter only with concatenation
+        kind = rng.random()
+        if kind < 0.5:
+            operators = _OPERATORS[:2] if kind < 0.25 else _OPERATORS
+            value = numbers[0]
+            for number in numbers[1:]:
+                value = rng.choice(operators)(value, number)
+        else:
+            value = rng.randint(1, 10 ** rng.randint(3, 15))
+        yield '%d: %s' % (value, ' '.join(str(n) for n in numbers))
+
+
+_FREQUENCIES = string.digits + string.ascii_letters
+
+
+@generator('2024/08', 'grid side', 35)
+def gen_antennas(rng, size):
+    grid = [['.'] * size for _ in range(size)]
+    cells = rng.sample(range(size * size), max(size * size // 50, 2))
+    for cell in cells:
+        grid[cell // size][cell % size] = rng.choice(_FREQUENCIES)
+    return (''.join(row) for row in grid)
+
+
+@generator('2024/09', 'disk map digits', 2000)
+def gen_disk_map(rng, size):
+    files = (size + 1) // 2
+    digits = []
+    for _ in range(files):
+        digits.append(rng.randint(1, 9))
+        digits.append(rng.randint(0, 9))
+    yield ''.join(str(d) for d in digits[:2 * files - 1])
+
+
+@generator('2024/10', 'grid side', 35)
+def gen_topographic_map(rng, size):
+    grid = [[rng.randrange(10) for _ in range(size)] for _ in range(size)]
+    # plant climbing paths, so that there are trails to find
+    steps = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    for _ in range(size * size // 10):
+        path = [(rng.randrange(size), rng.randrange(size))]
+        while len(path) < 10:
+            row, col = path[-1]
+            options = [(row + dr, col + dc) for dr, dc in steps
+                       if 0 <= row + dr < size and 0 <= col + dc < size
+                       and (row + dr, col + dc) not in path]
+            if not options:
+                break
+            path.append(rng.choice(options))
+        if len(path) == 10:
+            for height, (row, col) in enumerate(path):
+                grid[row][col] = height
+    return (''.join(str(h) for h in row) for row in grid)
+
+
+@generator('2024/11', 'stones', 10)
+def gen_stones(rng, size):
+    yield ' '.join(str(rng.randrange(10 ** rng.randint(1, 7)))
+                   for _ in range(size))
+
+
+def main(inargs=None):
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic input for a day")
+    parser.add_argument(
+        '-s', '--seed',
+        type=int,
+        default=DEFAULT_SEED,
+        help="random seed (default: %(default)s)")
+    parser.add_argument(
+        '-o', '--output',
+        help="write to this file, rather than stdout")
+    parser.add_argument(
+        '-l', '--list',
+        action='store_true',
+        default=False,
+        help="list the days with generators, and exit")
+    parser.add_argument(
+        'day',
+        metavar='DAY',
+        nargs='?',
+        help="day to generate an input for, e.g. '2024/06'")
+    parser.add_argument(
+        'size',
+        metavar='SIZE',
+        type=int,
+        nargs='?',
+        help="size of the input")
+    args = parser.parse_args(inargs)
+
+    if args.list:
+        for gen in GENERATORS:
+            print('{:<8} {:<16} {:>6}'.format(gen.pattern, gen.unit, gen.base))
+        return
+    if args.day is None or args.size is None:
+        parser.error('DAY and SIZE are required')
+
+    try:
+        text = generate(args.day, args.size, seed=args.seed)
+    except (LookupError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == '__main__':
+    main()
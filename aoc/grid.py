@@ -0,0 +1,244 @@
+"""
+Array-backed grids.
+
+Many solutions read a map into a dict keyed by ``(row, col)`` tuples, which
+costs a tuple and a dict slot per cell, and a tuple and a hash per lookup.
+A :class:`Grid` stores the same cells in a flat :class:`bytearray` instead:
+
+- each cell is a single byte value (0-254)
+- cells are addressed by an integer index, ``row * stride + col``
+- neighbours are found by adding precomputed offsets to an index
+- the cells are surrounded by a border of :data:`GUARD` cells, so that
+  stepping off the map lands on a guard cell rather than wrapping around.
+
+Cells that are missing from a sparse map are also stored as :data:`GUARD`.
+
+:class:`GridMap` adapts a grid to the dict interface used by the existing
+solvers, so that they can run unchanged on a grid.  This is a compatibility
+check, to find solvers that depend on more than the mapping interface, and
+not a faster mode: the dict is still built first, and every lookup through
+the view is a Python-level call.
+
+The day modules don't import :mod:`aoc`, so a solver that needs the speed
+keeps a flat grid of its own, in the same layout: see ``read_map()`` in
+``2024/10-hoof-it``.
+"""
+import collections.abc
+
+# cell value for cells outside the grid (or missing from it)
+GUARD = 0xff
+
+
+def _check_value(value):
+    if not 0 <= value < GUARD:
+        raise ValueError("invalid cell value: %r" % (value,))
+    return value
+
+
+class Grid(object):
+    """ a rectangular grid of byte values. """
+
+    def __init__(self, height, width, border=1, fill=GUARD):
+        if height < 0 or width < 0:
+            raise ValueError("invalid grid size: %r" % ((height, width),))
+        if border < 1:
+            raise ValueError("invalid border: %r" % (border,))
+        self.height = height
+        self.width = width
+        self.border = border
+        self.stride = width + 2 * border
+        self.cells = bytearray([GUARD]) * (self.stride * (height + 2 * border))
+        if fill != GUARD:
+            row = bytes([_check_value(fill)]) * width
+            for rownum in range(height):
+                start = self.index(rownum, 0)
+                self.cells[start:start + width] = row
+
+        # neighbour offsets, clockwise from up
+        s = self.stride
+        self.up, self.right, self.down, self.left = (-s, 1, s, -1)
+        self.neighbours4 = (-s, 1, s, -1)
+        self.neighbours8 = (-s, -s + 1, 1, s + 1, s, s - 1, -1, -s - 1)
+
+    def __repr__(self):
+        return '<Grid %dx%d>' % (self.height, self.width)
+
+    def index(self, row, col):
+        """ get the cell index of a *row* and *col*. """
+        return (row + self.border) * self.stride + col + self.border
+
+    def position(self, index):
+        """ get the (row, col) position of a cell *index*. """
+        row, col = divmod(index, self.stride)
+        return (row - self.border, col - self.border)
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, index):
+        return self.cells[index]
+
+    def __setitem__(self, index, value):
+        self.cells[index] = value
+
+    def __contains__(self, index):
+        """ check if *index* is a (non-guard) cell in the grid. """
+        return 0 <= index < len(self.cells) and self.cells[index] != GUARD
+
+    def indices(self):
+        """ iterate over the index of all cells, in row order. """
+        for row in range(self.height):
+            start = self.index(row, 0)
+            for index in range(start, start + self.width):
+                if self.cells[index] != GUARD:
+                    yield index
+
+    def find(self, value):
+        """ iterate over the index of all cells with a given *value*. """
+        needle = bytes([value])
+        index = self.cells.find(needle)
+        while index >= 0:
+            yield index
+            index = self.cells.find(needle, index + 1)
+
+    def rows(self):
+        """ iterate over rows of cell values, as bytes. """
+        for row in range(self.height):
+            start = self.index(row, 0)
+            yield bytes(self.cells[start:start + self.width])
+
+    def copy(self):
+        obj = type(self).__new__(type(self))
+        obj.__dict__.update(self.__dict__)
+        obj.cells = bytearray(self.cells)
+        return obj
+
+    @classmethod
+    def from_lines(cls, lines, border=1, encode=ord):
+        """
+        create a grid from *lines* of text.
+
+        Empty lines are ignored.  Each character is converted to a cell value
+        using *encode*.
+        """
+        rows = []
+        for lineno, raw_line in enumerate(lines, 1):
+            line = raw_line.strip()
+            if not line:
+                continue
+            if rows and len(line) != len(rows[0]):
+                raise ValueError("invalid line length on line %d (%r)"
+                                 % (lineno, raw_line))
+            rows.append(bytes(_check_value(encode(c)) for c in line))
+
+        obj = cls(len(rows), len(rows[0]) if rows else 0, border=border)
+        for rownum, row in enumerate(rows):
+            start = obj.index(rownum, 0)
+            obj.cells[start:start + obj.width] = row
+        return obj
+
+    @classmethod
+    def from_mapping(cls, mapping, border=1, encode=ord):
+        """
+        create a grid from a dict of ``(row, col)`` keys.
+
+        Values are converted to cell values using *encode*.  Positions that
+        are missing from *mapping* are set to :data:`GUARD`.
+        """
+        if not mapping:
+            return cls(0, 0, border=border)
+        rows = [row for row, _ in mapping]
+        cols = [col for _, col in mapping]
+        if min(rows) < 0 or min(cols) < 0:
+            raise ValueError("negative grid position")
+        obj = cls(max(rows) + 1, max(cols) + 1, border=border)
+        for (row, col), value in mapping.items():
+            obj.cells[obj.index(row, col)] = _check_value(encode(value))
+        return obj
+
+
+def _identity(value):
+    return value
+
+
+class GridMap(collections.abc.MutableMapping):
+    """
+    dict-like view of a :class:`Grid`, keyed by ``(row, col)``.
+
+    Values are converted with *decode* when read, and *encode* when written.
+    The grid can't grow, so only existing positions can be set.
+    """
+
+    def __init__(self, grid, decode=chr, encode=ord):
+        self.grid = grid
+        self.decode = decode
+        self.encode = encode
+
+    def __repr__(self):
+        return '<GridMap %r>' % (self.grid,)
+
+    def _index(self, key):
+        try:
+            row, col = key
+        except (TypeError, ValueError):
+            raise KeyError(key)
+        if not self.grid.in_bounds(row, col):
+            raise KeyError(key)
+        return self.grid.index(row, col)
+
+    def __getitem__(self, key):
+        value = self.grid.cells[self._index(key)]
+        if value == GUARD:
+            raise KeyError(key)
+        return self.decode(value)
+
+    def __setitem__(self, key, value):
+        self.grid.cells[self._index(key)] = _check_value(self.encode(value))
+
+    def __delitem__(self, key):
+        self.grid.cells[self._index(key)] = GUARD
+
+    def __contains__(self, key):
+        try:
+            return self.grid.cells[self._index(key)] != GUARD
+        except KeyError:
+            return False
+
+    def __iter__(self):
+        return (self.grid.position(index) for index in self.grid.indices())
+
+    def __len__(self):
+        return sum(1 for _ in self.grid.indices())
+
+    def copy(self):
+        return type(self)(self.grid.copy(), self.decode, self.encode)
+
+    @classmethod
+    def from_mapping(cls, mapping, border=1):
+        """
+        create a grid view with the same content as a dict *mapping*.
+
+        Values must be either single characters or small integers.
+        """
+        sample = next(iter(mapping.values()), '')
+        if isinstance(sample, str):
+            decode, encode = chr, ord
+        else:
+            decode, encode = _identity, _identity
+        grid = Grid.from_mapping(mapping, border=border, encode=encode)
+        return cls(grid, decode, encode)
+
+
+def is_grid_mapping(value):
+    """ check if *value* is a dict keyed by (row, col) tuples. """
+    if not isinstance(value, dict) or not value:
+        return False
+    return all(isinstance(k, tuple) and len(k) == 2
+               and isinstance(k[0], int) and isinstance(k[1], int)
+               for k in value)
+
+
+def adapt_args(args):
+    """ replace all (row, col) dicts in solver *args* with grid views. """
+    return tuple(GridMap.from_mapping(arg) if is_grid_mapping(arg) else arg
+                 for arg in args)
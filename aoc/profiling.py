@@ -0,0 +1,90 @@
+"""
+Profile solution phases.
+
+Helpers for running a single phase (parse, part 1, part 2) of a day under
+:mod:`cProfile` and/or :mod:`tracemalloc`, and for reporting the results.
+"""
+import cProfile
+import io
+import pstats
+import tracemalloc
+
+from .days import Timer
+
+
+class PhaseReport(object):
+    """ timing, profile and memory use of a single phase. """
+
+    def __init__(self, name):
+        self.name = name
+        self.elapsed = None
+        self.stats = None
+        self.peak = None
+        self.caches = {}
+
+
+def get_caches(module):
+    """ find all functools caches in a *module*. """
+    return {name: value for name, value in sorted(vars(module).items())
+            if callable(getattr(value, 'cache_info', None))}
+
+
+def run_phase(name, func, args, profile=False, trace_memory=False,
+              module=None):
+    """
+    run ``func(*args)`` as a phase called *name*.
+
+    :param bool profile: collect a cProfile profile
+    :param bool trace_memory: trace peak memory use with tracemalloc
+    :param module: collect functools cache statistics from this module
+
+    :returns tuple: the result, and a :class:`PhaseReport`
+    """
+    report = PhaseReport(name)
+    profiler = cProfile.Profile() if profile else None
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with Timer() as t:
+            if profiler:
+                result = profiler.runcall(func, *args)
+            else:
+                result = func(*args)
+        if trace_memory:
+            report.peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    report.elapsed = t.elapsed
+    if profiler:
+        report.stats = pstats.Stats(profiler)
+    if module is not None:
+        report.caches = {name: cached.cache_info()
+                         for name, cached in get_caches(module).items()}
+    return result, report
+
+
+def format_size(size):
+    """ format a number of bytes as a human readable size. """
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < 1024:
+            return '%.1f %s' % (size, unit)
+        size /= 1024
+    return '%.1f GiB' % size
+
+
+def format_report(report, top=20):
+    """ format a :class:`PhaseReport` as text. """
+    lines = ['--- %s: %.3fs' % (report.name, report.elapsed)]
+    if report.peak is not None:
+        lines.append('peak memory: %s' % format_size(report.peak))
+    for name, info in report.caches.items():
+        lines.append('cache %s: hits=%d, misses=%d, size=%d'
+                     % (name, info.hits, info.misses, info.currsize))
+    if report.stats is not None:
+        stream = io.StringIO()
+        report.stats.stream = stream
+        report.stats.sort_stats('cumulative').print_stats(top)
+        lines.append(stream.getvalue().strip('\n'))
+    return '\n'.join(lines)
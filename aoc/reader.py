@@ -0,0 +1,144 @@
+"""
+Bytes-level input readers.
+
+The day modules read their input line by line, as text.  For large inputs,
+these readers work on the raw bytes of a memory-mapped file instead:
+
+- :func:`iter_rows` gives zero-copy views of each non-empty line
+- :func:`read_int_columns` reads whitespace separated integer columns into
+  typed arrays, converting a block of lines at a time
+- :func:`read_grid` copies rows straight into an :class:`aoc.grid.Grid`
+
+::
+
+    with map_file('input.txt') as data:
+        left, right = read_int_columns(data, 2)
+
+The day modules are standalone and don't import :mod:`aoc`, so they keep
+their own readers.  These are for tools and scripts working on large
+(e.g. generated) inputs.
+"""
+import array
+import contextlib
+import mmap
+
+from .grid import GUARD, Grid
+
+# translation table from ascii digits to their values
+DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+_WHITESPACE = b' \t\r\n\x0b\x0c'
+
+# bytes to convert at a time, see iter_blocks()
+BLOCK_SIZE = 1 << 20
+
+
+@contextlib.contextmanager
+def map_file(filename):
+    """ memory-map *filename* for reading. """
+    with open(filename, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be mapped
+            yield b''
+            return
+        try:
+            yield data
+        finally:
+            data.close()
+
+
+def iter_rows(data):
+    """
+    iterate over non-empty lines in *data*.
+
+    Each row is a :class:`memoryview` of the line, without any trailing
+    whitespace.  The views must be released before the underlying mmap is
+    closed.
+    """
+    view = memoryview(data)
+    start = 0
+    size = len(data)
+    while start < size:
+        end = data.find(b'\n', start)
+        if end < 0:
+            end = size
+        stop = end
+        while stop > start and data[stop - 1] in _WHITESPACE:
+            stop -= 1
+        if stop > start:
+            yield view[start:stop]
+        start = end + 1
+
+
+def iter_blocks(data, block_size=BLOCK_SIZE):
+    """
+    iterate over blocks of about *block_size* bytes of *data*.
+
+    Blocks end after a line break where possible, so that no line is split
+    between two blocks.  Each block is a copy, so only one block at a time
+    is held in memory, rather than all of *data*.
+    """
+    start = 0
+    size = len(data)
+    while start < size:
+        end = start + block_size
+        if end < size:
+            cut = data.rfind(b'\n', start, end)
+            if cut < 0:
+                # a single line longer than the block
+                cut = data.find(b'\n', end)
+            end = size if cut < 0 else cut + 1
+        yield data[start:end]
+        start = end
+
+
+def read_int_columns(data, columns, typecode='q', block_size=BLOCK_SIZE):
+    """
+    read whitespace separated integers in *data* as *columns* arrays.
+
+    Values are read in row order, so the n-th value goes to column
+    ``n % columns``.  *data* is converted a block at a time, see
+    :func:`iter_blocks`.
+
+    :raises ValueError:
+        if the number of values is not a multiple of *columns*
+    """
+    numbers = array.array(typecode)
+    for block in iter_blocks(data, block_size):
+        # splitting a whole block is much faster than splitting row by row
+        numbers.extend(map(int, block.split()))
+    if len(numbers) % columns:
+        raise ValueError("invalid input: %d values in %d columns"
+                         % (len(numbers), columns))
+    return tuple(numbers[col::columns] for col in range(columns))
+
+
+def read_grid(data, border=1, table=None):
+    """
+    read a grid of characters from *data*.
+
+    Each cell gets the byte value of its character, or the value from a
+    translation *table* (e.g. :data:`DIGITS`).
+
+    :raises ValueError:
+        if the rows have different lengths, or a cell would be a GUARD value
+    """
+    rows = []
+    for lineno, row in enumerate(iter_rows(data), 1):
+        if rows and len(row) != len(rows[0]):
+            raise ValueError("invalid row length on row %d (%d, expected %d)"
+                             % (lineno, len(row), len(rows[0])))
+        rows.append(row)
+
+    grid = Grid(len(rows), len(rows[0]) if rows else 0, border=border)
+    for rownum, row in enumerate(rows):
+        if table is not None:
+            row = bytes(row).translate(table)
+        start = grid.index(rownum, 0)
+        grid.cells[start:start + grid.width] = row
+
+    if grid.cells.count(GUARD) != len(grid.cells) - grid.height * grid.width:
+        raise ValueError("invalid cell value %r in input" % (GUARD,))
+    return grid
@@ -0,0 +1,195 @@
+"""
+Run and verify solutions.
+
+Runs every day with a ``solutions.txt`` in a pool of worker processes,
+checks the answers, and prints a table of wall times:
+
+::
+
+    python -m aoc.run
+    python -m aoc.run --jobs 4 2024 2023/05
+
+The exit status is non-zero if any answer is wrong, or if any day fails.
+"""
+import argparse
+import collections
+import contextlib
+import functools
+import io
+import multiprocessing
+import os
+import sys
+import traceback
+
+from .cache import InputCache
+from .days import PARTS, Timer, find_days, is_correct, read_solutions
+from .grid import adapt_args
+
+
+Result = collections.namedtuple(
+    'Result',
+    ('day', 'filename', 'timings', 'answers', 'expected', 'error'))
+
+
+def _solve_phases(day, filename, expected, grid=False, cache=None):
+    """ run parse and each part of *day* separately. """
+    timings = {}
+    answers = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        with Timer() as t:
+            if cache:
+                args = cache.load_input(day, day.get_input(filename))
+            else:
+                args = day.load_input(day.get_input(filename))
+            if grid:
+                args = adapt_args(args)
+        timings['parse'] = t.elapsed
+        for part in PARTS:
+            if part not in expected:
+                continue
+            with Timer() as t:
+                answers[part] = day.solve(part, args)
+            timings[part] = t.elapsed
+    return timings, answers
+
+
+def _solve_main(day, filename, expected, grid=False, cache=None):
+    """ run the main() of *day*, and pick answers from its output. """
+    with Timer() as t:
+        output = day.run_main(day.get_input(filename))
+    results = read_solutions(
+        line for line in io.StringIO(output) if line.startswith('Part '))
+    answers = results.get(filename) or {}
+    return {'total': t.elapsed}, answers
+
+
+def run_day(day, grid=False, cache=None):
+    """
+    solve all inputs from the solutions file of *day*.
+
+    :param bool grid:
+        run solvers on :class:`aoc.grid.GridMap` views rather than dicts,
+        to check that they only use the mapping interface
+    :param InputCache cache:
+        load parsed inputs from this cache
+    """
+    results = []
+    try:
+        solutions = day.solutions
+        solver = _solve_phases if day.has_phases else _solve_main
+    except Exception:
+        return [Result(day, None, {}, {}, {}, traceback.format_exc())]
+
+    for filename, expected in solutions.items():
+        if not os.path.exists(day.get_input(filename)):
+            results.append(Result(day, filename, {}, {}, expected,
+                                  'missing input file'))
+            continue
+        try:
+            timings, answers = solver(day, filename, expected,
+                                       grid=grid, cache=cache)
+            error = None
+        except Exception:
+            timings, answers = {}, {}
+            error = traceback.format_exc()
+        results.append(
+            Result(day, filename, timings, answers, expected, error))
+    return results
+
+
+def get_status(result):
+    """ get a short status text for a *result*. """
+    if result.error:
+        return 'error: ' + result.error.strip().splitlines()[-1]
+    wrong = [part for part, value in sorted(result.expected.items())
+             if not is_correct(result.day, value, result.answers.get(part))]
+    if wrong:
+        return 'wrong: ' + ', '.join('part %d' % p for p in wrong)
+    return 'ok'
+
+
+def format_time(seconds):
+    if seconds is None:
+        return '-'
+    return '%.3fs' % seconds
+
+
+TABLE_FORMAT = '{:<36} {:<28} {:>9} {:>9} {:>9} {:>9}  {}'
+
+
+def format_header():
+    return TABLE_FORMAT.format('day', 'input', 'parse', 'part 1', 'part 2',
+                               'total', 'status')
+
+
+def format_result(result):
+    timings = result.timings
+    total = timings.get('total', sum(timings.values()) if timings else None)
+    return TABLE_FORMAT.format(
+        result.day.name,
+        result.filename or '-',
+        format_time(timings.get('parse')),
+        format_time(timings.get(1)),
+        format_time(timings.get(2)),
+        format_time(total),
+        get_status(result),
+    )
+
+
+def main(inargs=None):
+    parser = argparse.ArgumentParser(
+        description="Run and verify solutions against solutions.txt")
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (default: %(default)s)")
+    parser.add_argument(
+        '-g', '--grid',
+        action='store_true',
+        default=False,
+        help="check that solvers also work on array-backed grid views "
+             "rather than dicts (slower)")
+    parser.add_argument(
+        '-c', '--cache',
+        action='store_true',
+        default=False,
+        help="cache parsed inputs (in AOC_CACHE_DIR, default: .cache/aoc)")
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        default=False,
+        help="show tracebacks for failed days")
+    parser.add_argument(
+        'patterns',
+        metavar='DAY',
+        nargs='*',
+        help="only run days matching these patterns, e.g. '2024/06'")
+    args = parser.parse_args(inargs)
+
+    days = find_days(patterns=args.patterns)
+    if not days:
+        parser.error('no matching days')
+
+    inputs = failed = 0
+    print(format_header())
+    with Timer() as t, multiprocessing.Pool(args.jobs) as pool:
+        solver = functools.partial(run_day, grid=args.grid,
+                                   cache=InputCache() if args.cache else None)
+        for results in pool.imap(solver, days):
+            for result in results:
+                inputs += 1
+                print(format_result(result))
+                sys.stdout.flush()
+                if get_status(result) != 'ok':
+                    failed += 1
+                    if args.verbose and result.error:
+                        print(result.error, file=sys.stderr)
+
+    print('\n%d days, %d inputs, %d failures, %s wall time'
+          % (len(days), inputs, failed, format_time(t.elapsed)))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
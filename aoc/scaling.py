@@ -0,0 +1,164 @@
+"""
+Measure how solutions scale with input size.
+
+Runs each phase of a day on generated inputs (see :mod:`aoc.generate`) of
+increasing size, and fits the empirical complexity exponent *k* in
+``time ~ bytes ** k`` by least squares on the log-log timings.  The
+exponent is relative to the input size in bytes, so a solution that is
+linear in the number of grid cells has an exponent close to 1.
+
+::
+
+    python -m aoc.scaling 2024/02 2024/09
+    python -m aoc.scaling --sizes 20,40,80 --max-exponent 1.5 2023/11
+
+By default, each generator is run at 1, 2, 4 and 8 times its base size.
+
+The exit status is non-zero if any phase scales worse than
+``--max-exponent``.
+"""
+import argparse
+import math
+import os
+import sys
+import tempfile
+
+from .bench import get_phases, time_phases
+from .days import find_days
+from .generate import DEFAULT_SEED, find_generator, generate
+from .run import format_time
+
+# multiples of the generator base size
+DEFAULT_SCALES = (1, 2, 4, 8)
+
+
+def fit_exponent(sizes, times):
+    """
+    fit ``time = c * size ** k`` to measurements, and return *k*.
+
+    Measurements with a zero time are ignored.
+
+    :returns float: the exponent, or None if there are too few measurements
+    """
+    points = [(math.log(s), math.log(t))
+              for s, t in zip(sizes, times) if s > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var:
+        return None
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return cov / var
+
+
+def measure(day, sizes, repeat=1, seed=DEFAULT_SEED):
+    """
+    time each phase of a *day* on generated inputs of *sizes*.
+
+    :returns tuple:
+        the input sizes in bytes, and a mapping of phase name to the best
+        time for each size.
+    """
+    nbytes = []
+    timings = {phase: [] for phase in get_phases(day)}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in sizes:
+            filename = os.path.join(tmpdir, 'input-%d.txt' % size)
+            with open(filename, 'w') as f:
+                f.write(generate(day.name, size, seed=seed))
+            nbytes.append(os.path.getsize(filename))
+
+            best = {}
+            for _ in range(repeat):
+                for phase, t in time_phases(day, filename).items():
+                    best[phase] = min(t, best.get(phase, t))
+            for phase, t in best.items():
+                timings[phase].append(t)
+    return nbytes, timings
+
+
+def parse_sizes(value):
+    """ parse a comma separated list of sizes. """
+    sizes = [int(size) for size in value.split(',')]
+    if len(sizes) < 2 or min(sizes) < 1:
+        raise argparse.ArgumentTypeError('need at least two positive sizes')
+    return sorted(sizes)
+
+
+def get_sizes(generator, scales=DEFAULT_SCALES):
+    """ get input sizes for a *generator*, as multiples of its base size. """
+    return [generator.base * scale for scale in scales]
+
+
+def main(inargs=None):
+    parser = argparse.ArgumentParser(
+        description="Fit complexity exponents on generated inputs")
+    parser.add_argument(
+        '--sizes',
+        type=parse_sizes,
+        help="comma separated generator sizes (default: %s times the "
+             "generator's base size)"
+             % ','.join(str(s) for s in DEFAULT_SCALES))
+    parser.add_argument(
+        '-r', '--repeat',
+        type=int,
+        default=1,
+        help="number of timed runs per size (default: %(default)s)")
+    parser.add_argument(
+        '-s', '--seed',
+        type=int,
+        default=DEFAULT_SEED,
+        help="random seed for the generators (default: %(default)s)")
+    parser.add_argument(
+        '--max-exponent',
+        type=float,
+        help="fail if any phase scales worse than this")
+    parser.add_argument(
+        'patterns',
+        metavar='DAY',
+        nargs='+',
+        help="days to measure, e.g. '2024/06'")
+    args = parser.parse_args(inargs)
+
+    if args.repeat < 1:
+        parser.error('invalid --repeat: must be at least 1')
+
+    days = []
+    for day in find_days(patterns=args.patterns):
+        try:
+            gen = find_generator(day.name)
+        except LookupError:
+            print('skipping %s: no generator' % (day.name,), file=sys.stderr)
+            continue
+        days.append((day, args.sizes or get_sizes(gen)))
+    if not days:
+        parser.error('no matching days with a generator')
+
+    failures = 0
+    for day, sizes in days:
+        nbytes, timings = measure(day, sizes, repeat=args.repeat,
+                                  seed=args.seed)
+        print(day.name)
+        print('  {:<8} {}'.format(
+            'bytes', ' '.join('{:>9}'.format(n) for n in nbytes)))
+        for phase, times in timings.items():
+            exponent = fit_exponent(nbytes, times)
+            flag = ''
+            if (args.max_exponent is not None and exponent is not None
+                    and exponent > args.max_exponent):
+                flag = '  !'
+                failures += 1
+            print('  {:<8} {}  k={}{}'.format(
+                phase,
+                ' '.join('{:>9}'.format(format_time(t)) for t in times),
+                '-' if exponent is None else '%.2f' % exponent,
+                flag))
+        sys.stdout.flush()
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
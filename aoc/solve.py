@@ -0,0 +1,234 @@
+"""
+Solve a single day.
+
+A shared main() for the day modules, with the same output as the day's own
+``solve.py``, and additional run modes:
+
+::
+
+    python -m aoc.solve 2024/06
+    python -m aoc.solve 2024/06 example.txt input.txt
+    python -m aoc.solve --profile --trace-memory 2023/12
+    python -m aoc.solve --jobs 8 2024/06 generated/*.txt
+    python -m aoc.solve --parallel-parts 2024/06
+    python -m aoc.solve --verbose 2024/06 big.txt
+
+Input files are looked up relative to the current directory, and then
+relative to the day directory.  Profile reports are written to stderr, so
+that stdout only has the solutions.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+
+from .days import PARTS, find_days
+from .profiling import format_report, run_phase
+
+
+def get_day(parser, pattern):
+    """ find a single day matching *pattern*, or exit with an error. """
+    days = find_days(patterns=[pattern])
+    if len(days) != 1:
+        parser.error('%r matches %d days' % (pattern, len(days)))
+    day = days[0]
+    if not day.has_phases:
+        parser.error('%s has no load_input(), run its main() instead'
+                     % (day.name,))
+    return day
+
+
+def get_input(day, filename):
+    """ find an input *filename*, relative to cwd or the *day* directory. """
+    if os.path.exists(filename):
+        return filename
+    return day.get_input(filename)
+
+
+def format_answer(part, answer):
+    """ format an answer like the day modules do. """
+    value = str(answer)
+    sep = '\n' if '\n' in value else ' '
+    return 'Part %d:%s%s' % (part, sep, value)
+
+
+# (day, solver arguments) for forked part workers
+_shared = None
+
+
+def _solve_part(part):
+    """ solve a part in a forked worker, using the inherited arguments. """
+    day, args = _shared
+    return day.solve(part, args)
+
+
+def solve_parts(day, args):
+    """
+    solve all parts of *day* in parallel.
+
+    Each part runs in its own forked worker process, which inherits the
+    parsed *args* from this process rather than getting a pickled copy.
+    Where fork is not available, the parts are solved one after another.
+
+    :returns generator: answers, in part order
+    """
+    global _shared
+    try:
+        context = multiprocessing.get_context('fork')
+    except ValueError:
+        yield from (day.solve(part, args) for part in PARTS)
+        return
+
+    _shared = (day, args)
+    try:
+        with context.Pool(len(PARTS)) as pool:
+            # workers are forked here, and _shared is no longer needed
+            _shared = None
+            yield from pool.imap(_solve_part, PARTS)
+    finally:
+        _shared = None
+
+
+def solve_input(day, filename, profile=False, trace_memory=False,
+                pstats_dir=None, top=20, parallel_parts=False):
+    """ solve a single input file, and yield output lines. """
+    if parallel_parts:
+        args = day.load_input(filename)
+        for part, answer in zip(PARTS, solve_parts(day, args)):
+            yield format_answer(part, answer)
+        return
+
+    reports = []
+    module = day.module
+    args, report = run_phase('parse', module.load_input, (filename,),
+                             profile=profile, trace_memory=trace_memory,
+                             module=module)
+    reports.append(report)
+    for part in PARTS:
+        solver = getattr(module, 'solve_pt%d' % part)
+        answer, report = run_phase('part %d' % part, solver, args,
+                                   profile=profile, trace_memory=trace_memory,
+                                   module=module)
+        reports.append(report)
+        yield format_answer(part, answer)
+
+    if not (profile or trace_memory):
+        return
+
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    for report in reports:
+        print(format_report(report, top=top) + '\n', file=sys.stderr)
+        if pstats_dir and report.stats is not None:
+            name = '%s-%s.pstats' % (stem, report.name.replace(' ', ''))
+            report.stats.dump_stats(os.path.join(pstats_dir, name))
+
+
+def _solve_file(task):
+    """ solve an input file in a worker process. """
+    day, filename = task
+    return list(solve_input(day, filename))
+
+
+def solve_files(day, files, jobs):
+    """
+    solve input *files* in a pool of *jobs* worker processes.
+
+    :returns generator:
+        output lines for each file, in the same order as *files*.
+    """
+    with multiprocessing.Pool(jobs) as pool:
+        yield from pool.imap(_solve_file, [(day, f) for f in files])
+
+
+def main(inargs=None):
+    parser = argparse.ArgumentParser(
+        description="Solve a day, with optional profiling")
+    parser.add_argument(
+        '-p', '--profile',
+        action='store_true',
+        default=False,
+        help="profile each phase, and show the top functions")
+    parser.add_argument(
+        '-m', '--trace-memory',
+        action='store_true',
+        default=False,
+        help="show peak memory use of each phase")
+    parser.add_argument(
+        '--pstats',
+        metavar='DIR',
+        dest='pstats_dir',
+        help="write a .pstats file per phase to %(metavar)s")
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=20,
+        help="number of functions to show in profiles (default: %(default)s)")
+    parser.add_argument(
+        '-j', '--jobs',
+        metavar='N',
+        type=int,
+        default=1,
+        help="solve input files in %(metavar)s worker processes")
+    parser.add_argument(
+        '--parallel-parts',
+        action='store_true',
+        default=False,
+        help="parse once, and solve each part in its own process")
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        default=False,
+        help="show log messages from the day module on stderr")
+    parser.add_argument(
+        'day',
+        metavar='DAY',
+        help="day to solve, e.g. '2024/06'")
+    parser.add_argument(
+        'files',
+        metavar='FILE',
+        nargs='*',
+        help="input files (default: input.txt)")
+    args = parser.parse_args(inargs)
+
+    day = get_day(parser, args.day)
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO,
+                            format='%(name)s: %(message)s')
+    if args.pstats_dir:
+        args.profile = True
+        os.makedirs(args.pstats_dir, exist_ok=True)
+    if args.jobs < 1:
+        parser.error('invalid --jobs: must be at least 1')
+    if args.jobs > 1 and (args.profile or args.trace_memory):
+        parser.error('cannot profile with --jobs')
+    if args.parallel_parts and (args.profile or args.trace_memory):
+        parser.error('cannot profile with --parallel-parts')
+    if args.parallel_parts and args.jobs > 1:
+        parser.error('cannot combine --parallel-parts and --jobs')
+
+    files = args.files or [day.get_input()]
+    if args.jobs > 1:
+        paths = [get_input(day, filename) for filename in files]
+        results = solve_files(day, paths, args.jobs)
+        for i, (filename, lines) in enumerate(zip(files, results)):
+            print(bool(i) * "\n" + "Solutions for", filename)
+            print("\n".join(lines))
+            sys.stdout.flush()
+        return
+
+    for i, filename in enumerate(files):
+        print(bool(i) * "\n" + "Solutions for", filename)
+        sys.stdout.flush()
+        for line in solve_input(day, get_input(day, filename),
+                                profile=args.profile,
+                                trace_memory=args.trace_memory,
+                                pstats_dir=args.pstats_dir,
+                                top=args.top,
+                                parallel_parts=args.parallel_parts):
+            print(line)
+            sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+""" tests for aoc.bench """
+from aoc import bench
+
+
+def _stats(t):
+    return {'min': t, 'median': t, 'times': [t]}
+
+
+baseline = {
+    'day-a': {'parse': _stats(0.010), 'part 1': _stats(1.0)},
+    'day-b': {'part 1': _stats(0.0001)},
+}
+
+
+def test_compare_no_regression():
+    results = {'day-a': {'parse': _stats(0.011), 'part 1': _stats(0.5)}}
+    assert bench.compare(baseline, results, threshold=0.2) == []
+
+
+def test_compare_regression():
+    results = {'day-a': {'parse': _stats(0.010), 'part 1': _stats(1.5)}}
+    assert bench.compare(baseline, results, threshold=0.2) == [
+        ('day-a', 'part 1', 1.0, 1.5),
+    ]
+
+
+def test_compare_min_time():
+    results = {'day-b': {'part 1': _stats(0.0005)}}
+    assert bench.compare(baseline, results, min_time=0.001) == []
+
+
+def test_compare_new_day():
+    results = {'day-c': {'part 1': _stats(10.0)}}
+    assert bench.compare(baseline, results) == []
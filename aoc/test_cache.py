@@ -0,0 +1,52 @@
+""" tests for aoc.cache """
+import shutil
+
+from aoc import cache as mod
+from aoc.days import find_days
+
+
+def _get_day():
+    day, = find_days(patterns=['2024/01'])
+    return day
+
+
+def test_get_dependencies():
+    day = _get_day()
+    deps = mod.get_dependencies(day.module, day.module.load_input)
+    assert set(deps) == {'load_input', 'read_input'}
+
+
+def test_hash_parser_stable():
+    day = _get_day()
+    assert mod.hash_parser(day.module) == mod.hash_parser(day.module)
+
+
+def test_load_input(tmp_path):
+    day = _get_day()
+    filename = str(tmp_path / 'input.txt')
+    shutil.copy(day.get_input('example.txt'), filename)
+    cache = mod.InputCache(str(tmp_path / 'cache'))
+
+    args = cache.load_input(day, filename)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert cache.load_input(day, filename) == args
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_input_changed(tmp_path):
+    day = _get_day()
+    filename = str(tmp_path / 'input.txt')
+    shutil.copy(day.get_input('example.txt'), filename)
+    cache = mod.InputCache(str(tmp_path / 'cache'))
+    cache.load_input(day, filename)
+
+    with open(filename, 'a') as f:
+        f.write('10   20\n')
+    args = cache.load_input(day, filename)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert args[0][0][-1] == 10
+
+
+def test_unpicklable(tmp_path):
+    cache = mod.InputCache(str(tmp_path))
+    assert not cache.store(str(tmp_path / 'x.pickle'), (lambda: None,))
@@ -0,0 +1,35 @@
+""" tests for aoc.daemon """
+import pytest
+
+from aoc import daemon as mod
+from aoc.days import find_days
+
+
+@pytest.fixture(scope='module')
+def index():
+    return mod.DayIndex(find_days(patterns=['2024/0[12]']))
+
+
+def test_index_get(index):
+    assert index.get({'day': '2024/01'}).name == '2024/01-historian-hysteria'
+    assert index.get({'year': 2024, 'day': 2}).name == \
+        '2024/02-red-nosed-reports'
+
+
+def test_index_get_missing(index):
+    with pytest.raises(LookupError):
+        index.get({'day': '2024/03'})
+
+
+def test_solve_request(index):
+    response = mod.solve_request(
+        index, {'day': '2024/01', 'part': None, 'input': 'example.txt'})
+    assert response['lines'] == ['Part 1: 11', 'Part 2: 31']
+    assert [phase for phase, _ in response['timings']] == [
+        'parse', 'part 1', 'part 2']
+
+
+def test_solve_request_part(index):
+    response = mod.solve_request(
+        index, {'year': 2024, 'day': 1, 'part': 2, 'input': 'example.txt'})
+    assert response['lines'] == ['Part 2: 31']
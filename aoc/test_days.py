@@ -0,0 +1,51 @@
+""" tests for aoc.days """
+import io
+
+from aoc import days
+
+
+solutions_text = """
+Solutions for example.txt
+Part 1: 13140
+Part 2:
+##..##
+###...
+
+Solutions for /some/path/input.txt
+Part 1: 14780
+Part 2: EZFPRAKL
+""".lstrip()
+
+
+legacy_text = """
+Part 1: 239
+Part 2: 188
+""".lstrip()
+
+
+def test_read_solutions():
+    with io.StringIO(solutions_text) as f:
+        solutions = days.read_solutions(f)
+    assert solutions == {
+        'example.txt': {1: '13140', 2: '##..##\n###...'},
+        'input.txt': {1: '14780', 2: 'EZFPRAKL'},
+    }
+
+
+def test_read_solutions_default_input():
+    with io.StringIO(legacy_text) as f:
+        solutions = days.read_solutions(f)
+    assert solutions == {'input.txt': {1: '239', 2: '188'}}
+
+
+def test_find_days():
+    names = [day.name for day in days.find_days(patterns=['2024/0[12]'])]
+    assert names == ['2024/01-historian-hysteria', '2024/02-red-nosed-reports']
+
+
+def test_day_phases():
+    day, = days.find_days(patterns=['2024/01'])
+    assert day.has_phases
+    args = day.load_input(day.get_input('example.txt'))
+    assert day.solve(1, args) == 11
+    assert day.solve(2, args) == 31
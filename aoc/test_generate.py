@@ -0,0 +1,41 @@
+""" tests for aoc.generate """
+import pytest
+
+from aoc import generate
+from aoc.days import find_days
+
+patterns = [gen.pattern for gen in generate.GENERATORS]
+
+
+@pytest.mark.parametrize('pattern', patterns)
+def test_generate_parses(tmp_path, pattern):
+    days = find_days(patterns=[pattern])
+    assert len(days) == 1
+    day = days[0]
+    filename = tmp_path / 'input.txt'
+    filename.write_text(generate.generate(day.name, 10))
+    assert day.load_input(str(filename))
+
+
+def test_generate_is_deterministic():
+    assert (generate.generate('2024/06', 20, seed=3)
+            == generate.generate('2024/06', 20, seed=3))
+    assert (generate.generate('2024/06', 20, seed=3)
+            != generate.generate('2024/06', 20, seed=4))
+
+
+def test_find_generator_missing():
+    with pytest.raises(LookupError):
+        generate.find_generator('2020/01-report')
+
+
+def test_generate_invalid_size():
+    with pytest.raises(ValueError):
+        generate.generate('2024/01', 0)
+
+
+def test_guard_path_length():
+    grid = [list(row) for row in ('.#.', '..#', '.^.')]
+    assert generate._guard_path_length(grid, 2, 1) == 5
+    grid = [list(row) for row in ('.#..', '...#', '#^..', '..#.')]
+    assert generate._guard_path_length(grid, 2, 1) is None
@@ -0,0 +1,90 @@
+""" tests for aoc.grid """
+import pytest
+
+from aoc import grid as mod
+
+
+lines = """
+#..
+.^.
+..#
+""".strip().splitlines()
+
+
+mapping = {
+    (0, 0): '#', (0, 1): '.', (0, 2): '.',
+    (1, 0): '.', (1, 1): '^', (1, 2): '.',
+    (2, 0): '.', (2, 1): '.', (2, 2): '#',
+}
+
+
+def test_index_position():
+    grid = mod.Grid(3, 4)
+    for row in range(3):
+        for col in range(4):
+            assert grid.position(grid.index(row, col)) == (row, col)
+
+
+def test_from_lines():
+    grid = mod.Grid.from_lines(lines)
+    assert (grid.height, grid.width) == (3, 3)
+    assert list(grid.rows()) == [b'#..', b'.^.', b'..#']
+    start = grid.index(1, 1)
+    assert grid[start] == ord('^')
+
+
+def test_from_lines_invalid():
+    with pytest.raises(ValueError):
+        mod.Grid.from_lines(['...', '..'])
+
+
+def test_guard_border():
+    grid = mod.Grid.from_lines(lines)
+    corner = grid.index(0, 0)
+    assert corner in grid
+    assert [corner + d in grid for d in grid.neighbours4] == [
+        False, True, True, False]
+
+
+def test_find():
+    grid = mod.Grid.from_lines(lines)
+    found = [grid.position(i) for i in grid.find(ord('#'))]
+    assert found == [(0, 0), (2, 2)]
+
+
+def test_grid_map():
+    view = mod.GridMap.from_mapping(mapping)
+    assert dict(view) == mapping
+    assert (1, 1) in view
+    assert (3, 0) not in view
+    assert (-1, 0) not in view
+    assert view.get((0, 3)) is None
+
+
+def test_grid_map_sparse():
+    sparse = {(0, 0): 1, (1, 1): 9}
+    view = mod.GridMap.from_mapping(sparse)
+    assert dict(view) == sparse
+    assert (0, 1) not in view
+    assert len(view) == 2
+
+
+def test_grid_map_copy():
+    view = mod.GridMap.from_mapping(mapping)
+    other = view.copy()
+    other[(0, 0)] = '.'
+    assert view[(0, 0)] == '#'
+    assert other[(0, 0)] == '.'
+
+
+def test_grid_map_outside():
+    view = mod.GridMap.from_mapping(mapping)
+    with pytest.raises(KeyError):
+        view[(3, 3)] = '#'
+
+
+def test_adapt_args():
+    start = ((1, 1), (-1, 0))
+    args = mod.adapt_args((start, mapping))
+    assert args[0] == start
+    assert isinstance(args[1], mod.GridMap)
@@ -0,0 +1,44 @@
+""" tests for aoc.profiling """
+import functools
+import types
+
+from aoc import profiling as mod
+
+
+@functools.cache
+def _fib(n):
+    return n if n < 2 else _fib(n - 1) + _fib(n - 2)
+
+
+def test_run_phase():
+    result, report = mod.run_phase('test', sum, ([1, 2, 3],))
+    assert result == 6
+    assert report.elapsed >= 0
+    assert report.stats is None
+    assert report.peak is None
+
+
+def test_run_phase_profile():
+    result, report = mod.run_phase('test', sorted, ([3, 1, 2],), profile=True)
+    assert result == [1, 2, 3]
+    assert report.stats is not None
+    assert 'test' in mod.format_report(report)
+
+
+def test_run_phase_trace_memory():
+    _, report = mod.run_phase('test', list, (range(10000),),
+                              trace_memory=True)
+    assert report.peak > 10000
+
+
+def test_run_phase_caches():
+    module = types.ModuleType('test_module')
+    module.fib = _fib
+    _fib.cache_clear()
+    _, report = mod.run_phase('test', _fib, (10,), module=module)
+    assert report.caches['fib'].misses == 11
+
+
+def test_format_size():
+    assert mod.format_size(512) == '512.0 B'
+    assert mod.format_size(3 * 1024 * 1024) == '3.0 MiB'
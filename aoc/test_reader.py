@@ -0,0 +1,83 @@
+""" tests for aoc.reader """
+import pytest
+
+from aoc import reader as mod
+
+
+columns_text = b"""
+3   4
+4   3
+2   5
+
+1   3
+"""
+
+grid_text = b"""
+0123
+4567\r
+"""
+
+
+def test_map_file(tmp_path):
+    filename = tmp_path / 'input.txt'
+    filename.write_bytes(columns_text)
+    with mod.map_file(str(filename)) as data:
+        assert data[:] == columns_text
+
+
+def test_map_empty_file(tmp_path):
+    filename = tmp_path / 'input.txt'
+    filename.write_bytes(b'')
+    with mod.map_file(str(filename)) as data:
+        assert list(mod.iter_rows(data)) == []
+
+
+def test_iter_rows():
+    rows = [bytes(row) for row in mod.iter_rows(grid_text)]
+    assert rows == [b'0123', b'4567']
+
+
+def test_read_int_columns():
+    left, right = mod.read_int_columns(columns_text, 2)
+    assert list(left) == [3, 4, 2, 1]
+    assert list(right) == [4, 3, 5, 3]
+
+
+@pytest.mark.parametrize('block_size', (1, 4, 7, 1000))
+def test_iter_blocks(block_size):
+    blocks = list(mod.iter_blocks(columns_text, block_size))
+    assert b''.join(blocks) == columns_text
+    assert all(block.endswith(b'\n') for block in blocks)
+
+
+def test_iter_blocks_long_line():
+    data = b'1 2 3 4\n5 6\n7'
+    assert list(mod.iter_blocks(data, 3)) == [b'1 2 3 4\n', b'5 6\n', b'7']
+
+
+def test_read_int_columns_blocks():
+    left, right = mod.read_int_columns(columns_text, 2, block_size=5)
+    assert list(left) == [3, 4, 2, 1]
+    assert list(right) == [4, 3, 5, 3]
+
+
+def test_read_int_columns_invalid():
+    with pytest.raises(ValueError):
+        mod.read_int_columns(b'1 2\n3\n', 2)
+
+
+def test_read_grid():
+    grid = mod.read_grid(grid_text)
+    assert list(grid.rows()) == [b'0123', b'4567']
+
+
+def test_read_grid_digits():
+    grid = mod.read_grid(grid_text, table=mod.DIGITS)
+    assert list(grid.rows()) == [bytes(range(4)), bytes(range(4, 8))]
+
+
+def test_read_grid_invalid():
+    with pytest.raises(ValueError):
+        mod.read_grid(b'012\n34\n')
+    with pytest.raises(ValueError):
+        mod.read_grid(b'01\n2\xff\n')
@@ -0,0 +1,28 @@
+""" tests for aoc.scaling """
+import pytest
+
+from aoc import scaling
+from aoc.generate import find_generator
+
+
+def test_fit_exponent_linear():
+    sizes = [10, 20, 40, 80]
+    times = [0.1 * s for s in sizes]
+    assert scaling.fit_exponent(sizes, times) == pytest.approx(1.0)
+
+
+def test_fit_exponent_quadratic():
+    sizes = [10, 20, 40, 80]
+    times = [0.001 * s ** 2 for s in sizes]
+    assert scaling.fit_exponent(sizes, times) == pytest.approx(2.0)
+
+
+def test_fit_exponent_ignores_zero_times():
+    assert scaling.fit_exponent([10, 20, 40], [0.0, 2.0, 4.0]) == \
+        pytest.approx(1.0)
+    assert scaling.fit_exponent([10, 20], [0.0, 1.0]) is None
+
+
+def test_get_sizes():
+    gen = find_generator('2024/06-guard-gallivant')
+    assert scaling.get_sizes(gen, (1, 2)) == [gen.base, 2 * gen.base]
@@ -0,0 +1,18 @@
+"""
+pytest configuration.
+
+Day tests import their solution with ``import solve``, from the day
+directory.  Every day has its own ``solve`` module, so one cached from
+another day is dropped before a test module is collected.
+"""
+import os
+import sys
+
+
+def pytest_collectstart(collector):
+    module = sys.modules.get('solve')
+    path = getattr(collector, 'path', None)
+    if module is None or path is None or path.suffix != '.py':
+        return
+    if os.path.dirname(os.path.abspath(module.__file__)) != str(path.parent):
+        del sys.modules['solve']